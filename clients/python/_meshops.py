@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Loop-heavy mesh post-processing kernels (bounding box, normal recompute).
+
+When Numba is installed the kernels are JIT-compiled with fastmath and
+fuse the per-vertex/per-triangle passes into single loops; otherwise
+vectorized NumPy fallbacks are used. Numba is optional:
+    pip install numba
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(fastmath=True, cache=True)
+    def compute_bbox(vertices):
+        """Min/max corners of an (N, 3) float32 vertex array in one pass"""
+        mins = np.full(3, np.inf, dtype=np.float32)
+        maxs = np.full(3, -np.inf, dtype=np.float32)
+        for i in range(vertices.shape[0]):
+            for j in range(3):
+                value = vertices[i, j]
+                if value < mins[j]:
+                    mins[j] = value
+                if value > maxs[j]:
+                    maxs[j] = value
+        return mins, maxs
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def recompute_normals(vertices, indices):
+        """Area-weighted smooth vertex normals from triangle indices"""
+        out = np.zeros(vertices.shape, dtype=np.float32)
+        # Accumulation must stay serial (concurrent += on shared vertices
+        # would race); normalization below parallelizes cleanly.
+        for t in range(indices.shape[0] // 3):
+            i0 = indices[3 * t]
+            i1 = indices[3 * t + 1]
+            i2 = indices[3 * t + 2]
+            e1x = vertices[i1, 0] - vertices[i0, 0]
+            e1y = vertices[i1, 1] - vertices[i0, 1]
+            e1z = vertices[i1, 2] - vertices[i0, 2]
+            e2x = vertices[i2, 0] - vertices[i0, 0]
+            e2y = vertices[i2, 1] - vertices[i0, 1]
+            e2z = vertices[i2, 2] - vertices[i0, 2]
+            nx = e1y * e2z - e1z * e2y
+            ny = e1z * e2x - e1x * e2z
+            nz = e1x * e2y - e1y * e2x
+            out[i0, 0] += nx
+            out[i0, 1] += ny
+            out[i0, 2] += nz
+            out[i1, 0] += nx
+            out[i1, 1] += ny
+            out[i1, 2] += nz
+            out[i2, 0] += nx
+            out[i2, 1] += ny
+            out[i2, 2] += nz
+        for i in prange(out.shape[0]):
+            length = np.sqrt(out[i, 0] ** 2 + out[i, 1] ** 2 + out[i, 2] ** 2)
+            if length > 0.0:
+                out[i, 0] /= length
+                out[i, 1] /= length
+                out[i, 2] /= length
+        return out
+
+else:
+
+    def compute_bbox(vertices):
+        """Min/max corners of an (N, 3) float32 vertex array"""
+        if vertices.shape[0] == 0:
+            # Match the Numba kernel's empty-input result instead of letting
+            # min()/max() raise on a zero-size reduction
+            return (np.full(3, np.inf, dtype=np.float32),
+                    np.full(3, -np.inf, dtype=np.float32))
+        return vertices.min(axis=0), vertices.max(axis=0)
+
+    def recompute_normals(vertices, indices):
+        """Area-weighted smooth vertex normals from triangle indices"""
+        triangles = indices.reshape(-1, 3).astype(np.intp)
+        edge1 = vertices[triangles[:, 1]] - vertices[triangles[:, 0]]
+        edge2 = vertices[triangles[:, 2]] - vertices[triangles[:, 0]]
+        face_normals = np.cross(edge1, edge2)
+        out = np.zeros(vertices.shape, dtype=np.float32)
+        for column in range(3):
+            np.add.at(out, triangles[:, column], face_normals)
+        lengths = np.linalg.norm(out, axis=1, keepdims=True)
+        np.divide(out, lengths, out=out, where=lengths > 0.0)
+        return out
+
+
+def analyze_mesh(vertices, indices):
+    """Compute bbox and centroid for a decoded mesh.
+
+    Returns a dict with 'bbox_min', 'bbox_max' and 'centroid' float32 arrays.
+    Empty meshes (the server emits bare MeshData for shapes it could not
+    mesh) map to None values rather than an inf bbox and NaN centroid.
+    """
+    if len(vertices) == 0:
+        return {'bbox_min': None, 'bbox_max': None, 'centroid': None}
+    bbox_min, bbox_max = compute_bbox(vertices)
+    return {
+        'bbox_min': bbox_min,
+        'bbox_max': bbox_max,
+        'centroid': vertices.mean(axis=0, dtype=np.float64).astype(np.float32),
+    }
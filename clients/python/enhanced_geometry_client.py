@@ -6,13 +6,14 @@ Includes model import functionality similar to C++ client
 
 import sys
 import os
+import asyncio
+import mmap
 import grpc
 import numpy as np
 import concurrent.futures
 import threading
 import time
 from typing import List, Tuple, Optional, Dict, Any, Callable
-from dataclasses import dataclass, field
 from pathlib import Path
 
 # Add generated proto files to path
@@ -22,122 +23,254 @@ import geometry_service_pb2
 import geometry_service_pb2_grpc
 import geometry_types_pb2
 
+from mesh_codec import decode_mesh_data, mesh_buffer_views, pack_meshes_into_arena
+from _meshops import analyze_mesh
+
+
+# Precomputed suffix -> format table; one dict lookup per file instead of
+# two string allocations (.upper() + slicing) on batch imports
+_SUFFIX_TO_FORMAT = {
+    '.step': 'STEP', '.stp': 'STEP',
+    '.iges': 'IGES', '.igs': 'IGES',
+    '.brep': 'BREP',
+    '.stl': 'STL',
+    '.obj': 'OBJ',
+    '.ply': 'PLY',
+}
+
+# Task/options/result objects use __slots__ instead of @dataclass: no
+# per-instance __dict__, which matters when thousands of import tasks are
+# tracked at once.
 
-@dataclass
 class ImportTask:
-    """Represents an async import task"""
-    id: str
-    file_path: str
-    file_name: str
-    format: str = ""
-    future: Optional[concurrent.futures.Future] = None
-    progress: float = 0.0
-    is_active: bool = True
-    status_message: str = "Starting..."
-    start_time: float = field(default_factory=time.time)
-    shape_ids: List[str] = field(default_factory=list)
-    error: Optional[str] = None
-
-
-@dataclass 
+    """Represents an async import task.
+
+    Progress/status/active are kept in one immutable tuple swapped with a
+    single reference assignment, so worker threads can publish updates and
+    the UI thread can read consistent snapshots without a lock.
+    """
+    __slots__ = ('id', 'file_path', 'file_name', 'format', 'future', '_state',
+                 'start_time', 'shape_ids', 'error', 'callback')
+
+    def __init__(self, id: str, file_path: str, file_name: str, format: str = ""):
+        self.id = id
+        self.file_path = file_path
+        self.file_name = file_name
+        self.format = format
+        self.future: Optional[concurrent.futures.Future] = None
+        self._state = (0.0, "Starting...", True)  # (progress, status, is_active)
+        self.start_time: float = time.time()
+        self.shape_ids: List[str] = []
+        self.error: Optional[str] = None
+        self.callback: Optional[Callable[['ImportTask'], None]] = None
+
+    @property
+    def progress(self) -> float:
+        return self._state[0]
+
+    @property
+    def status_message(self) -> str:
+        return self._state[1]
+
+    @property
+    def is_active(self) -> bool:
+        return self._state[2]
+
+    def update_state(self, progress: float = None, status_message: str = None,
+                     is_active: bool = None):
+        """Atomically swap in a new (progress, status, is_active) snapshot"""
+        current = self._state
+        self._state = (
+            current[0] if progress is None else progress,
+            current[1] if status_message is None else status_message,
+            current[2] if is_active is None else is_active,
+        )
+
+
 class ModelImportOptions:
     """Model import options matching C++ client"""
-    auto_detect_format: bool = True
-    force_format: str = ""
-    import_colors: bool = True
-    import_names: bool = True
-    precision: float = 0.01
-    merge_shapes: bool = False
+    __slots__ = ('auto_detect_format', 'force_format', 'import_colors',
+                 'import_names', 'precision', 'merge_shapes')
+
+    def __init__(self, auto_detect_format: bool = True, force_format: str = "",
+                 import_colors: bool = True, import_names: bool = True,
+                 precision: float = 0.01, merge_shapes: bool = False):
+        self.auto_detect_format = auto_detect_format
+        self.force_format = force_format
+        self.import_colors = import_colors
+        self.import_names = import_names
+        self.precision = precision
+        self.merge_shapes = merge_shapes
 
 
-@dataclass
 class ModelImportResult:
     """Result of model import operation"""
-    success: bool = False
-    message: str = ""
-    detected_format: str = ""
-    shape_ids: List[str] = field(default_factory=list)
-    filename: str = ""
-    file_size: int = 0
-    shape_count: int = 0
-    format: str = ""
-    creation_time: str = ""
+    __slots__ = ('success', 'message', 'detected_format', 'shape_ids',
+                 'filename', 'file_size', 'shape_count', 'format', 'creation_time')
+
+    def __init__(self):
+        self.success: bool = False
+        self.message: str = ""
+        self.detected_format: str = ""
+        self.shape_ids: List[str] = []
+        self.filename: str = ""
+        self.file_size: int = 0
+        self.shape_count: int = 0
+        self.format: str = ""
+        self.creation_time: str = ""
 
 
 class EnhancedGeometryClient:
     """Enhanced geometry client with import functionality"""
     
+    # One HTTP/2 channel serializes concurrent streams; a small aio channel
+    # pool lets parallel imports use independent connections
+    CHANNEL_POOL_SIZE = 4
+
+    _BASE_CHANNEL_OPTIONS = [
+        ('grpc.max_receive_message_length', 100 * 1024 * 1024),  # 100MB
+        ('grpc.max_send_message_length', 100 * 1024 * 1024),
+        ('grpc.keepalive_time_ms', 30000),
+    ]
+
     def __init__(self, server_address: str = "localhost:50051", client_id: str = "PythonClient"):
         """Initialize enhanced client"""
         self.server_address = server_address
         self.channel = None
         self.stub = None
-        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=5)
+        # Import fan-out runs on grpc.aio: one background event loop
+        # multiplexes all in-flight imports instead of one blocked thread
+        # per RPC
+        self._loop = None
+        self._loop_thread = None
+        self._aio_channels = []
+        self._aio_stubs = []
         self.import_tasks: Dict[str, ImportTask] = {}
+        # IDs of tasks still in flight, so active/completed queries do not
+        # rescan the full task history
+        self._active_ids: set = set()
         self.task_counter = 0
-        self.progress_callbacks: Dict[str, Callable[[ImportTask], None]] = {}
         self.client_id = client_id
+        # Request templates reused via CopyFrom so hot-path calls mutate
+        # fields in place instead of rebuilding nested submessages
+        self._box_template = geometry_service_pb2.BoxRequest(
+            position=geometry_types_pb2.Point3D())
+        self._sphere_template = geometry_service_pb2.SphereRequest(
+            center=geometry_types_pb2.Point3D())
         self.metadata = [('client-id', client_id)]  # gRPC metadata for all requests
         
+    def _open_channels(self):
+        """Open the sync channel and start the aio import loop (idempotent).
+
+        Failed connect() attempts land here again on every retry, so reuse
+        what already exists instead of leaking a channel, loop and thread
+        per attempt; the channel reconnects on its own once the server is
+        reachable.
+        """
+        # Single sync channel for sequential (non-import) calls; imports run
+        # over the aio channel pool (see _aio_import_stub)
+        if self.channel is None:
+            self.channel = grpc.insecure_channel(self.server_address,
+                                                 options=self._BASE_CHANNEL_OPTIONS)
+            self.stub = geometry_service_pb2_grpc.GeometryServiceStub(self.channel)
+
+        # Start the asyncio loop that drives import RPCs
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(
+                target=self._loop.run_forever, name="grpc-aio-loop", daemon=True)
+            self._loop_thread.start()
+
     def connect(self) -> bool:
-        """Connect to the gRPC server"""
+        """Connect to the gRPC server (blocks up to 2s on the probe RPC)"""
+        call = self.connect_async()
         try:
-            options = [
-                ('grpc.max_receive_message_length', 100 * 1024 * 1024),  # 100MB
-                ('grpc.max_send_message_length', 100 * 1024 * 1024),
-            ]
-            self.channel = grpc.insecure_channel(self.server_address, options=options)
-            self.stub = geometry_service_pb2_grpc.GeometryServiceStub(self.channel)
-            
-            # Test connection
-            request = geometry_service_pb2.EmptyRequest()
-            response = self.stub.GetSystemInfo(request, timeout=2.0, metadata=self.metadata)
+            response = call.result(timeout=2.0)
             print(f"Connected to GeometryServer v{response.version}")
             print(f"OCCT Version: {response.occt_version}")
             return True
         except grpc.RpcError as e:
             print(f"Failed to connect: {e}")
             return False
-            
+
+    def connect_async(self, on_connected: Callable[[bool], None] = None):
+        """
+        Start connecting without blocking the calling thread.
+        Returns the probe-call future; the optional callback receives
+        True/False once the connection test completes.
+        """
+        self._open_channels()
+
+        request = geometry_service_pb2.EmptyRequest()
+        call = self.stub.GetSystemInfo.future(request, timeout=2.0, metadata=self.metadata)
+
+        if on_connected:
+            def _done(fut):
+                try:
+                    response = fut.result()
+                    print(f"Connected to GeometryServer v{response.version}")
+                    print(f"OCCT Version: {response.occt_version}")
+                    on_connected(True)
+                except grpc.RpcError as e:
+                    print(f"Failed to connect: {e}")
+                    on_connected(False)
+            call.add_done_callback(_done)
+        return call
+
     def disconnect_from_server(self):
-        """Notify server of disconnection"""
+        """Notify server of disconnection (non-blocking, returns the call future)"""
         if self.channel and self.stub:
-            try:
-                request = geometry_service_pb2.EmptyRequest()
-                response = self.stub.DisconnectClient(request, timeout=2.0, metadata=self.metadata)
-                if response.success:
-                    print(f"Successfully notified server of disconnection: {response.message}")
-                    return True
-                else:
-                    print(f"Failed to notify server of disconnection: {response.message}")
-                    return False
-            except grpc.RpcError as e:
-                print(f"Failed to notify server of disconnection: {e}")
-                return False
-        return False
-            
+            request = geometry_service_pb2.EmptyRequest()
+            call = self.stub.DisconnectClient.future(request, timeout=2.0, metadata=self.metadata)
+
+            def _log_result(fut):
+                try:
+                    response = fut.result()
+                    if response.success:
+                        print(f"Successfully notified server of disconnection: {response.message}")
+                    else:
+                        print(f"Failed to notify server of disconnection: {response.message}")
+                except grpc.RpcError as e:
+                    print(f"Failed to notify server of disconnection: {e}")
+
+            call.add_done_callback(_log_result)
+            return call
+        return None
+
     def disconnect(self):
         """Close the connection"""
         if self.channel:
-            # Notify server before disconnecting
-            self.disconnect_from_server()
-            
+            # Kick off the disconnect notification; it completes while the
+            # local teardown below runs instead of blocking ahead of it
+            notify_call = self.disconnect_from_server()
+
             # Cancel all active tasks
             for task_id in list(self.import_tasks.keys()):
                 self.cancel_import_task(task_id)
-            
-            self.executor.shutdown(wait=True)
+
+            self._shutdown_aio_loop()
+
+            if notify_call is not None:
+                try:
+                    notify_call.result(timeout=2.0)
+                except Exception:
+                    pass  # Already logged by the done callback
+
             self.channel.close()
+            self.channel = None
+            self.stub = None
             
     def create_box(self, x: float, y: float, z: float, 
                    dx: float, dy: float, dz: float) -> str:
         """Create a box primitive"""
-        request = geometry_service_pb2.BoxRequest(
-            position=geometry_types_pb2.Point3D(x=x, y=y, z=z),
-            width=dx,
-            height=dy,
-            depth=dz
-        )
+        request = geometry_service_pb2.BoxRequest()
+        request.CopyFrom(self._box_template)
+        request.position.x = x
+        request.position.y = y
+        request.position.z = z
+        request.width = dx
+        request.height = dy
+        request.depth = dz
         response = self.stub.CreateBox(request, metadata=self.metadata)
         if response.success:
             return response.shape_id
@@ -146,16 +279,49 @@ class EnhancedGeometryClient:
             
     def create_sphere(self, x: float, y: float, z: float, radius: float) -> str:
         """Create a sphere primitive"""
-        request = geometry_service_pb2.SphereRequest(
-            center=geometry_types_pb2.Point3D(x=x, y=y, z=z),
-            radius=radius
-        )
+        request = geometry_service_pb2.SphereRequest()
+        request.CopyFrom(self._sphere_template)
+        request.center.x = x
+        request.center.y = y
+        request.center.z = z
+        request.radius = radius
         response = self.stub.CreateSphere(request, metadata=self.metadata)
         if response.success:
             return response.shape_id
         else:
             raise Exception(f"Failed to create sphere: {response.message}")
-            
+
+    def create_shapes_batch(self, specs) -> List[str]:
+        """
+        Create several primitives with a single round trip
+        specs is a sequence of ShapeSpec messages (see box_spec/sphere_spec);
+        returns the created shape IDs in request order
+        """
+        request = geometry_service_pb2.BatchCreateRequest(specs=specs)
+        response = self.stub.CreateShapesBatch(request, metadata=self.metadata)
+        if not response.success:
+            failures = [r.message for r in response.responses if not r.success]
+            raise Exception(f"Batch create failed: {response.message} ({failures})")
+        return [r.shape_id for r in response.responses]
+
+    @staticmethod
+    def box_spec(x: float, y: float, z: float,
+                 dx: float, dy: float, dz: float) -> 'geometry_service_pb2.ShapeSpec':
+        """Build a ShapeSpec for a box (for create_shapes_batch)"""
+        return geometry_service_pb2.ShapeSpec(
+            box=geometry_service_pb2.BoxRequest(
+                position=geometry_types_pb2.Point3D(x=x, y=y, z=z),
+                width=dx, height=dy, depth=dz))
+
+    @staticmethod
+    def sphere_spec(x: float, y: float, z: float,
+                    radius: float) -> 'geometry_service_pb2.ShapeSpec':
+        """Build a ShapeSpec for a sphere (for create_shapes_batch)"""
+        return geometry_service_pb2.ShapeSpec(
+            sphere=geometry_service_pb2.SphereRequest(
+                center=geometry_types_pb2.Point3D(x=x, y=y, z=z),
+                radius=radius))
+
     def clear_all(self):
         """Clear all shapes on server"""
         request = geometry_service_pb2.EmptyRequest()
@@ -165,97 +331,252 @@ class EnhancedGeometryClient:
         else:
             print(f"Clear failed: {response.message}")
             
-    def get_all_meshes(self) -> List[dict]:
-        """Get all meshes using streaming"""
+    def get_meshes(self, shape_ids) -> Dict[str, tuple]:
+        """
+        Get meshes for several shapes with a single RPC round trip
+        Returns dict mapping shape_id to (vertices, normals, indices)
+        """
+        request = geometry_service_pb2.ShapeIdList(shape_ids=shape_ids)
+        meshes = {}
+        # The server gzips this response stream (see GetMeshDataBatch impl)
+        for mesh_data in self.stub.GetMeshDataBatch(
+                request, metadata=self.metadata):
+            meshes[mesh_data.shape_id] = decode_mesh_data(mesh_data)
+        return meshes
+
+    def iter_all_meshes(self, analyze: bool = False):
+        """
+        Yield mesh dicts one by one as the server stream delivers them
+        Lets callers overlap network/decoding with display (progressive render)
+        """
         request = geometry_service_pb2.EmptyRequest()
-        meshes = []
-        
         for mesh_data in self.stub.GetAllMeshes(request, metadata=self.metadata):
-            vertices = np.array([[v.x, v.y, v.z] for v in mesh_data.vertices], dtype=np.float32)
-            normals = np.array([[n.x, n.y, n.z] for n in mesh_data.normals], dtype=np.float32)
-            indices = np.array(mesh_data.indices, dtype=np.uint32)
-            
-            meshes.append({
+            vertices, normals, indices = decode_mesh_data(mesh_data)
+
+            mesh = {
                 'shape_id': mesh_data.shape_id,
                 'vertices': vertices,
                 'normals': normals,
-                'indices': indices
-            })
+                'indices': indices,
+                # Typed memoryviews over the same protobuf bytes for
+                # buffer-protocol consumers (e.g. moderngl) — zero-copy
+                'buffers': mesh_buffer_views(mesh_data)
+            }
+            if analyze:
+                mesh.update(analyze_mesh(vertices, indices))
             print(f"Received mesh for shape {mesh_data.shape_id}: {len(vertices)} vertices")
-                  
-        return meshes
-        
-    def import_model_async(self, file_path: str, options: ModelImportOptions = None, 
-                          progress_callback: Callable[[ImportTask], None] = None) -> str:
+            yield mesh
+
+    def get_all_meshes(self, analyze: bool = False) -> List[dict]:
+        """Get all meshes using streaming (analyze=True adds bbox/centroid)"""
+        return list(self.iter_all_meshes(analyze=analyze))
+
+    def get_all_meshes_packed(self):
+        """
+        Get all meshes packed into shared contiguous arenas
+        Returns (meshes, arenas): each mesh dict holds views into
+        arenas['vertices'/'normals'/'indices'], suitable for a single
+        GPU buffer upload
+        """
+        request = geometry_service_pb2.EmptyRequest()
+        stream = self.stub.GetAllMeshes(request, metadata=self.metadata)
+        return pack_meshes_into_arena(stream)
+
+
+    @staticmethod
+    def _build_proto_options(options: ModelImportOptions) -> geometry_service_pb2.ModelImportOptions:
+        """Build the protobuf message for a set of import options"""
+        return geometry_service_pb2.ModelImportOptions(
+            auto_detect_format=options.auto_detect_format,
+            force_format=options.force_format,
+            import_colors=options.import_colors,
+            import_names=options.import_names,
+            precision=options.precision,
+            merge_shapes=options.merge_shapes
+        )
+
+    # 1MB chunks overlap disk reads with network sends on uploads
+    UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+    def import_model_stream(self, file_path: str,
+                            options: ModelImportOptions = None) -> ModelImportResult:
+        """
+        Upload a model file to the server via client-streaming chunks.
+        Unlike import_model_async this does not require the server to share
+        this host's filesystem; the file is mmap'd so chunks slice the page
+        cache directly instead of being read twice.
+        """
+        if options is None:
+            options = ModelImportOptions()
+
+        path = Path(file_path)
+        options_proto = self._build_proto_options(options)
+
+        def chunk_generator():
+            with open(path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # First chunk carries filename and options
+                    first = geometry_service_pb2.ModelChunk(
+                        filename=path.name, data=mm[:self.UPLOAD_CHUNK_SIZE])
+                    first.options.CopyFrom(options_proto)
+                    yield first
+                    for offset in range(self.UPLOAD_CHUNK_SIZE, len(mm),
+                                        self.UPLOAD_CHUNK_SIZE):
+                        yield geometry_service_pb2.ModelChunk(
+                            data=mm[offset:offset + self.UPLOAD_CHUNK_SIZE])
+
+        # STEP/IGES/BREP are text formats that gzip 3-5x; compressing the
+        # upload stream trades CPU for most of the transfer time
+        response = self.stub.ImportModelStream(chunk_generator(), metadata=self.metadata,
+                                               compression=grpc.Compression.Gzip)
+
+        result = ModelImportResult()
+        result.success = response.success
+        result.message = response.message
+        result.detected_format = response.detected_format
+        # Keep the repeated-field container; it supports len/iteration/indexing
+        # without materializing a copy
+        result.shape_ids = response.shape_ids
+        if response.HasField('file_info'):
+            file_info = response.file_info
+            result.filename = file_info.filename
+            result.file_size = file_info.file_size
+            result.shape_count = file_info.shape_count
+            result.format = file_info.format
+            result.creation_time = file_info.creation_time
+
+        if result.success:
+            print(f"Uploaded {path.name}: {len(result.shape_ids)} shapes imported")
+        else:
+            print(f"Upload of {path.name} failed: {result.message}")
+        return result
+
+    def import_model_async(self, file_path, options: ModelImportOptions = None,
+                          progress_callback: Callable[[ImportTask], None] = None,
+                          options_proto=None) -> str:
         """
         Import a model file asynchronously
         Returns task ID for tracking progress
+        Accepts str or Path; pass a Path to avoid reparsing in batch imports
         """
+        # Refuse up front: registering the task first would leave an orphan
+        # entry in import_tasks/_active_ids with no future behind it
+        if self._loop is None:
+            raise RuntimeError("Not connected - call connect() before importing")
+
         if options is None:
             options = ModelImportOptions()
-            
+
         # Create task
         self.task_counter += 1
         task_id = f"import_{self.task_counter}"
-        
-        file_path = Path(file_path)
+
+        if not isinstance(file_path, Path):
+            file_path = Path(file_path)
         task = ImportTask(
             id=task_id,
-            file_path=str(file_path),
+            file_path=file_path.as_posix(),
             file_name=file_path.name,
-            format=file_path.suffix.upper().replace('.', '')
+            format=_SUFFIX_TO_FORMAT.get(file_path.suffix.lower(), '')
         )
         
         self.import_tasks[task_id] = task
-        
-        # Set progress callback
-        if progress_callback:
-            self.progress_callbacks[task_id] = progress_callback
-            
-        # Submit async task
-        task.future = self.executor.submit(self._import_model_worker, task, options)
+        self._active_ids.add(task_id)
+
+        # Callbacks are 1:1 with tasks, so they live on the task itself
+        task.callback = progress_callback
+
+
+        # Submit onto the aio loop, round-robining across the channel pool.
+        # run_coroutine_threadsafe returns a concurrent.futures.Future, so
+        # the task tracking/wait API is unchanged.
+        if options_proto is None:
+            options_proto = self._build_proto_options(options)
+        task.future = asyncio.run_coroutine_threadsafe(
+            self._import_model_worker(task, options_proto, self.task_counter - 1),
+            self._loop)
         
         print(f"Started async import of {task.file_name} (ID: {task_id})")
         return task_id
         
-    def _import_model_worker(self, task: ImportTask, options: ModelImportOptions) -> ModelImportResult:
-        """Worker function for async import"""
+    def _shutdown_aio_loop(self):
+        """Close aio channels and stop the background event loop"""
+        if self._loop is None:
+            return
+        if self._aio_channels:
+            channels = self._aio_channels
+
+            async def _close_channels():
+                for channel in channels:
+                    await channel.close()
+
+            try:
+                asyncio.run_coroutine_threadsafe(_close_channels(), self._loop).result(timeout=5.0)
+            except Exception as e:
+                print(f"Failed to close aio channels cleanly: {e}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._loop_thread:
+            self._loop_thread.join(timeout=5.0)
+        self._loop = None
+        self._loop_thread = None
+        self._aio_channels = []
+        self._aio_stubs = []
+
+    async def _aio_import_stub(self, index: int):
+        """Get the aio stub for a pool slot, creating the pool lazily on the loop"""
+        if not self._aio_stubs:
+            self._aio_channels = [
+                grpc.aio.insecure_channel(
+                    self.server_address,
+                    options=self._BASE_CHANNEL_OPTIONS + [('channel_pool_index', i)])
+                for i in range(self.CHANNEL_POOL_SIZE)
+            ]
+            self._aio_stubs = [
+                geometry_service_pb2_grpc.GeometryServiceStub(channel)
+                for channel in self._aio_channels
+            ]
+        return self._aio_stubs[index % len(self._aio_stubs)]
+
+    async def _import_model_worker(self, task: ImportTask,
+                                   options_proto: geometry_service_pb2.ModelImportOptions,
+                                   stub_index: int = 0) -> ModelImportResult:
+        """Coroutine driving one import on the shared event loop"""
         try:
-            task.status_message = "Preparing import..."
-            task.progress = 0.1
-            self._notify_progress(task)
-            
-            # Prepare request
-            request = geometry_service_pb2.ModelFileRequest(
-                file_path=task.file_path,
-                options=geometry_service_pb2.ModelImportOptions(
-                    auto_detect_format=options.auto_detect_format,
-                    force_format=options.force_format,
-                    import_colors=options.import_colors,
-                    import_names=options.import_names,
-                    precision=options.precision,
-                    merge_shapes=options.merge_shapes
-                )
-            )
-            
-            task.status_message = "Sending to server..."
-            task.progress = 0.3
-            self._notify_progress(task)
-            
-            # Make gRPC call
-            response = self.stub.ImportModelFile(request, metadata=self.metadata)
-            
-            task.progress = 0.8
+            task.update_state(progress=0.1, status_message="Preparing import...")
             self._notify_progress(task)
-            
+
+            # Prepare request; CopyFrom the shared template instead of
+            # re-running kwarg-to-field setters per import
+            request = geometry_service_pb2.ModelFileRequest(file_path=task.file_path)
+            request.options.CopyFrom(options_proto)
+
+            # Consume server-pushed progress on the pool stub assigned to
+            # this task; the loop keeps servicing other imports while this
+            # one is in flight. Each update maps straight onto the task
+            # state - no client-side guessing at stages, no status polling.
+            stub = await self._aio_import_stub(stub_index)
+            response = None
+            async for update in stub.ImportModelFileProgress(
+                    request, metadata=self.metadata):
+                if update.done:
+                    response = update.result
+                    break
+                task.update_state(progress=update.progress,
+                                  status_message=update.stage)
+                self._notify_progress(task)
+            if response is None:
+                raise RuntimeError("Import stream ended without a result")
+
+
             # Process result
             result = ModelImportResult()
             if response.success:
                 result.success = True
                 result.message = response.message
                 result.detected_format = response.detected_format
-                result.shape_ids = list(response.shape_ids)
-                
+                # Repeated-field container used as-is; no list() copy
+                result.shape_ids = response.shape_ids
+
                 if hasattr(response, 'file_info') and response.file_info:
                     file_info = response.file_info
                     result.filename = file_info.filename
@@ -265,31 +586,36 @@ class EnhancedGeometryClient:
                     result.creation_time = file_info.creation_time
                 
                 task.shape_ids = result.shape_ids
-                task.status_message = f"Import completed: {len(result.shape_ids)} shapes"
-                task.progress = 1.0
-                task.is_active = False
-                
+                task.update_state(
+                    progress=1.0,
+                    status_message=f"Import completed: {len(result.shape_ids)} shapes",
+                    is_active=False)
+                self._active_ids.discard(task.id)
+
             else:
                 result.message = response.message
                 task.error = response.message
-                task.status_message = f"Import failed: {response.message}"
-                task.is_active = False
-                
+                task.update_state(
+                    status_message=f"Import failed: {response.message}",
+                    is_active=False)
+                self._active_ids.discard(task.id)
+
             self._notify_progress(task)
             return result
             
         except Exception as e:
             task.error = str(e)
-            task.status_message = f"Exception: {str(e)}"
-            task.is_active = False
+            task.update_state(status_message=f"Exception: {str(e)}", is_active=False)
+            self._active_ids.discard(task.id)
             self._notify_progress(task)
             raise
             
     def _notify_progress(self, task: ImportTask):
         """Notify progress callback if registered"""
-        if task.id in self.progress_callbacks:
+        callback = task.callback
+        if callback is not None:
             try:
-                self.progress_callbacks[task.id](task)
+                callback(task)
             except Exception as e:
                 print(f"Progress callback error for {task.id}: {e}")
                 
@@ -303,14 +629,15 @@ class EnhancedGeometryClient:
             task = self.import_tasks[task_id]
             if task.future and not task.future.done():
                 task.future.cancel()
-                task.status_message = "Cancelled"
-                task.is_active = False
+                task.update_state(status_message="Cancelled", is_active=False)
+                self._active_ids.discard(task_id)
                 return True
         return False
         
     def get_active_tasks(self) -> List[ImportTask]:
-        """Get all active import tasks"""
-        return [task for task in self.import_tasks.values() if task.is_active]
+        """Get all active import tasks (O(active), not O(history))"""
+        return [self.import_tasks[task_id] for task_id in list(self._active_ids)
+                if task_id in self.import_tasks]
         
     def import_multiple_files(self, file_paths: List[str], 
                             options: ModelImportOptions = None) -> Dict[str, str]:
@@ -320,12 +647,18 @@ class EnhancedGeometryClient:
         """
         if options is None:
             options = ModelImportOptions()
-            
+
+        # All files share one options template
+        options_proto = self._build_proto_options(options)
         task_map = {}
-        
+
         for file_path in file_paths:
-            if os.path.exists(file_path):
-                task_id = self.import_model_async(file_path, options)
+            # Single stat per file; the Path object is handed on so
+            # import_model_async never reparses the string
+            path = Path(file_path)
+            if path.is_file():
+                task_id = self.import_model_async(path, options,
+                                                  options_proto=options_proto)
                 task_map[file_path] = task_id
             else:
                 print(f"File not found: {file_path}")
@@ -347,19 +680,30 @@ class EnhancedGeometryClient:
                 raise RuntimeError(f"Import task {task_id} failed: {e}")
         else:
             raise RuntimeError(f"Task {task_id} has no associated future")
-            
+
+    def wait_any(self, task_ids: List[str], timeout: float = 30.0):
+        """
+        Yield (task_id, future) pairs as imports finish, in completion order
+        A slow first import no longer blocks reaping already-finished ones
+        """
+        future_to_id = {self.import_tasks[task_id].future: task_id
+                        for task_id in task_ids
+                        if task_id in self.import_tasks
+                        and self.import_tasks[task_id].future}
+        for future in concurrent.futures.as_completed(future_to_id, timeout=timeout):
+            yield future_to_id[future], future
+
     def cleanup_completed_tasks(self):
         """Remove completed tasks from memory"""
         completed_tasks = [
-            task_id for task_id, task in self.import_tasks.items()
-            if not task.is_active and (not task.future or task.future.done())
+            task_id for task_id in (self.import_tasks.keys() - self._active_ids)
+            if (not self.import_tasks[task_id].future
+                or self.import_tasks[task_id].future.done())
         ]
-        
+
         for task_id in completed_tasks:
             if task_id in self.import_tasks:
                 del self.import_tasks[task_id]
-            if task_id in self.progress_callbacks:
-                del self.progress_callbacks[task_id]
                 
         if completed_tasks:
             print(f"Cleaned up {len(completed_tasks)} completed tasks")
@@ -399,14 +743,20 @@ def main():
         # Import multiple files
         task_map = client.import_multiple_files(test_files)
         
-        # Wait for completion
-        for file_path, task_id in task_map.items():
-            client.progress_callbacks[task_id] = progress_callback
-            try:
-                result = client.wait_for_import_completion(task_id, timeout=10.0)
-                print(f"\n[OK] {Path(file_path).name}: {len(result.shape_ids)} shapes imported")
-            except Exception as e:
-                print(f"\n[ERROR] {Path(file_path).name}: {e}")
+        # Reap results in completion order rather than submission order
+        for task_id in task_map.values():
+            client.import_tasks[task_id].callback = progress_callback
+        id_to_file = {task_id: file_path for file_path, task_id in task_map.items()}
+        try:
+            for task_id, future in client.wait_any(list(task_map.values()), timeout=10.0):
+                file_name = Path(id_to_file[task_id]).name
+                try:
+                    result = future.result()
+                    print(f"\n[OK] {file_name}: {len(result.shape_ids)} shapes imported")
+                except Exception as e:
+                    print(f"\n[ERROR] {file_name}: {e}")
+        except concurrent.futures.TimeoutError:
+            print("\n[ERROR] Timed out waiting for imports")
                 
         # Get final mesh data
         meshes = client.get_all_meshes()
@@ -8,7 +8,7 @@ import sys
 import os
 import grpc
 import numpy as np
-from typing import List, Tuple, Optional
+from typing import List, Optional, Sequence, Tuple
 
 # Add generated proto files to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'generated'))
@@ -17,6 +17,9 @@ import geometry_service_pb2
 import geometry_service_pb2_grpc
 import geometry_types_pb2
 
+from mesh_codec import decode_mesh_data, mesh_buffer_views
+from _meshops import analyze_mesh
+
 
 class GeometryClient:
     """Python client for GeometryServer"""
@@ -87,40 +90,53 @@ class GeometryClient:
         """
         request = geometry_service_pb2.ShapeRequest(shape_id=shape_id)
         response = self.stub.GetMeshData(request)
+
+        # Decode packed buffers into numpy arrays (zero-copy where possible)
+        return decode_mesh_data(response)
         
-        # Convert to numpy arrays for easy use with visualization libraries
-        vertices = np.array([[v.x, v.y, v.z] for v in response.vertices], dtype=np.float32)
-        normals = np.array([[n.x, n.y, n.z] for n in response.normals], dtype=np.float32)
-        indices = np.array(response.indices, dtype=np.uint32)
-        
-        return vertices, normals, indices
-        
-    def get_all_meshes(self) -> List[dict]:
+    def get_meshes(self, shape_ids: Sequence[str]) -> dict:
+        """
+        Get meshes for several shapes with a single RPC round trip
+        Returns dict mapping shape_id to (vertices, normals, indices)
+        """
+        request = geometry_service_pb2.ShapeIdList(shape_ids=shape_ids)
+        meshes = {}
+        # The server gzips this response stream (see GetMeshDataBatch impl)
+        for mesh_data in self.stub.GetMeshDataBatch(request):
+            meshes[mesh_data.shape_id] = decode_mesh_data(mesh_data)
+        return meshes
+
+    def get_all_meshes(self, analyze: bool = False) -> List[dict]:
         """
         Get all meshes using streaming
-        Returns list of mesh dictionaries
+        Returns list of mesh dictionaries; with analyze=True each dict also
+        carries 'bbox_min'/'bbox_max'/'centroid' computed by the JIT kernels
         """
         request = geometry_service_pb2.EmptyRequest()
         meshes = []
-        
-        # Server streaming RPC
+
+        # Server streaming RPC; the server gzips the response stream
         for mesh_data in self.stub.GetAllMeshes(request):
-            vertices = np.array([[v.x, v.y, v.z] for v in mesh_data.vertices], dtype=np.float32)
-            normals = np.array([[n.x, n.y, n.z] for n in mesh_data.normals], dtype=np.float32)
-            indices = np.array(mesh_data.indices, dtype=np.uint32)
-            
-            meshes.append({
+            vertices, normals, indices = decode_mesh_data(mesh_data)
+
+            mesh = {
                 'shape_id': mesh_data.shape_id,
                 'vertices': vertices,
                 'normals': normals,
-                'indices': indices
-            })
+                'indices': indices,
+                # Typed memoryviews over the same protobuf bytes for
+                # buffer-protocol consumers — zero-copy
+                'buffers': mesh_buffer_views(mesh_data)
+            }
+            if analyze:
+                mesh.update(analyze_mesh(vertices, indices))
+            meshes.append(mesh)
             print(f"Received mesh for shape {mesh_data.shape_id}: "
                   f"{len(vertices)} vertices")
                   
         return meshes
         
-    def import_model(self, file_path: str, auto_detect: bool = True) -> List[str]:
+    def import_model(self, file_path: str, auto_detect: bool = True) -> Sequence[str]:
         """Import a model file"""
         request = geometry_service_pb2.ModelFileRequest(
             file_path=file_path,
@@ -132,7 +148,9 @@ class GeometryClient:
         
         if response.success:
             print(f"Imported {response.detected_format} file: {len(response.shape_ids)} shapes")
-            return list(response.shape_ids)
+            # Return the repeated-field view directly; callers only need
+            # len/iteration/indexing
+            return response.shape_ids
         else:
             raise Exception(f"Import failed: {response.message}")
             
@@ -144,6 +162,7 @@ class GeometryClient:
                 format="STEP"
             )
         )
+        # The server gzips this response (see ExportModelFile impl)
         response = self.stub.ExportModelFile(request)
         
         if response.success:
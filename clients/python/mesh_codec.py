@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Shared decoding helpers for MeshData protobuf messages.
+
+Mesh geometry travels as packed binary buffers (vertices_raw/normals_q16/
+indices_raw) instead of one protobuf message per vertex, so decoding is a
+single np.frombuffer view per buffer rather than a Python loop.
+"""
+
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+# Normals are quantized to int16 on the wire (component * 32767)
+NORMAL_SCALE = np.float32(1.0 / 32767.0)
+
+
+def decode_mesh_data(mesh_data) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Decode a MeshData message into (vertices, normals, indices) arrays.
+
+    Vertices and indices are zero-copy: the returned arrays are read-only
+    views over the protobuf message buffer (float32 vertices as (N, 3),
+    uint32 indices as flat array). Normals are dequantized from int16 to
+    float32 (N, 3).
+    """
+    # Size arrays from the header-declared counts (fall back to inferring
+    # from payload length for messages without the header fields set)
+    vertex_count = mesh_data.vertex_count or len(mesh_data.vertices_raw) // 12
+    index_count = (mesh_data.triangle_count * 3
+                   or len(mesh_data.indices_raw) // 4)
+
+    vertices = np.frombuffer(mesh_data.vertices_raw, dtype=np.float32,
+                             count=vertex_count * 3).reshape(vertex_count, 3)
+    # Single fused multiply straight to float32; avoids the intermediate
+    # astype() array
+    normals = np.multiply(
+        np.frombuffer(mesh_data.normals_q16, dtype=np.int16,
+                      count=vertex_count * 3).reshape(vertex_count, 3),
+        NORMAL_SCALE, dtype=np.float32)
+    indices = np.frombuffer(mesh_data.indices_raw, dtype=np.uint32,
+                            count=index_count)
+    return vertices, normals, indices
+
+
+def mesh_buffer_views(mesh_data) -> dict:
+    """Wrap MeshData payloads as typed memoryviews (buffer protocol).
+
+    Returns {'vertices': float32 (N, 3) view, 'normals_q16': int16 (N, 3)
+    view of the quantized normals, 'indices': uint32 flat view}, all
+    zero-copy over the protobuf bytes. Anything that consumes the buffer
+    protocol (moderngl buffers, array.array, np.asarray) can share the
+    memory without going through NumPy first.
+
+    Empty payloads map to None: memoryview.cast rejects zero-sized shapes,
+    and the server emits bare MeshData (shape_id only) for shapes it could
+    not mesh.
+    """
+    vertex_count = mesh_data.vertex_count or len(mesh_data.vertices_raw) // 12
+    index_count = (mesh_data.triangle_count * 3
+                   or len(mesh_data.indices_raw) // 4)
+    return {
+        'vertices': memoryview(mesh_data.vertices_raw)
+            .cast('f', shape=(vertex_count, 3)) if vertex_count else None,
+        'normals_q16': memoryview(mesh_data.normals_q16)
+            .cast('h', shape=(vertex_count, 3)) if vertex_count else None,
+        'indices': memoryview(mesh_data.indices_raw)
+            .cast('I', shape=(index_count,)) if index_count else None,
+    }
+
+
+def pack_meshes_into_arena(mesh_datas: Iterable) -> Tuple[List[dict], dict]:
+    """Decode MeshData messages into shared arenas with per-mesh views.
+
+    Instead of one allocation per mesh, all vertices/normals/indices land in
+    three contiguous arrays ("arena + slices"); each returned mesh dict holds
+    views into them plus 'vertex_offset'/'index_offset'. The arenas dict
+    ('vertices', 'normals', 'indices') can be uploaded to the GPU with a
+    single glBufferData call.
+    """
+    messages = list(mesh_datas)
+    total_verts = sum(m.vertex_count or len(m.vertices_raw) // 12
+                      for m in messages)
+    total_indices = sum(m.triangle_count * 3 or len(m.indices_raw) // 4
+                        for m in messages)
+
+    arenas = {
+        'vertices': np.empty((total_verts, 3), np.float32),
+        'normals': np.empty((total_verts, 3), np.float32),
+        'indices': np.empty(total_indices, np.uint32),
+    }
+
+    meshes = []
+    vert_off = 0
+    idx_off = 0
+    for message in messages:
+        vertices, normals, indices = decode_mesh_data(message)
+        n = len(vertices)
+        k = len(indices)
+        arenas['vertices'][vert_off:vert_off + n] = vertices
+        arenas['normals'][vert_off:vert_off + n] = normals
+        arenas['indices'][idx_off:idx_off + k] = indices
+        meshes.append({
+            'shape_id': message.shape_id,
+            'vertices': arenas['vertices'][vert_off:vert_off + n],
+            'normals': arenas['normals'][vert_off:vert_off + n],
+            'indices': arenas['indices'][idx_off:idx_off + k],
+            'vertex_offset': vert_off,
+            'index_offset': idx_off,
+        })
+        vert_off += n
+        idx_off += k
+    return meshes, arenas
@@ -4,8 +4,15 @@ PythonOCC Client for GeometryServer
 Professional AIS-based 3D visualization using PythonOCC-core
 """
 
+import importlib
+import logging
+import math
 import sys
 import os
+from functools import lru_cache
+import time
+from collections import deque
+from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 import numpy as np
@@ -20,7 +27,7 @@ from enhanced_geometry_client import EnhancedGeometryClient, ModelImportOptions
 # PyQt5 imports for log window
 try:
     from PyQt5.QtWidgets import QWidget, QTextEdit, QVBoxLayout, QDockWidget, QMainWindow
-    from PyQt5.QtCore import Qt, QDateTime
+    from PyQt5.QtCore import Qt, QDateTime, QTimer
     from PyQt5.QtGui import QTextCursor, QColor, QTextCharFormat
     PYQT5_AVAILABLE = True
 except ImportError:
@@ -32,10 +39,14 @@ try:
     from OCC.Display.SimpleGui import init_display
     from OCC.Core.gp import gp_Pnt, gp_Dir, gp_Ax2
     from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox, BRepPrimAPI_MakeSphere, BRepPrimAPI_MakeCylinder
-    from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_MakeVertex
     from OCC.Core.BRepMesh import BRepMesh_IncrementalMesh
+    from OCC.Core.Bnd import Bnd_Box
+    from OCC.Core.BRepBndLib import brepbndlib
     from OCC.Core.StlAPI import StlAPI_Reader
-    from OCC.Core.AIS import AIS_ColoredShape, AIS_Trihedron
+    from OCC.Core.AIS import (
+        AIS_ColoredShape, AIS_PointCloud, AIS_Triangulation, AIS_Trihedron
+    )
+    from OCC.Core.Poly import Poly_Triangulation, Poly_Triangle
     from OCC.Core.Geom import Geom_Axis2Placement
     from OCC.Core.Quantity import (
         Quantity_Color, Quantity_TOC_RGB, 
@@ -43,6 +54,7 @@ try:
         Quantity_NOC_YELLOW, Quantity_NOC_CYAN, Quantity_NOC_ORANGE
     )
     from OCC.Core.Graphic3d import (
+        Graphic3d_ArrayOfPoints,
         Graphic3d_NOM_BRASS, Graphic3d_NOM_BRONZE,
         Graphic3d_NOM_COPPER, Graphic3d_NOM_GOLD,
         Graphic3d_NOM_PEWTER, Graphic3d_NOM_PLASTER,
@@ -55,9 +67,79 @@ except ImportError:
     sys.exit(1)
 
 
+# Console logging goes through a standard logger so noisy sections can be
+# silenced with logging.getLogger("pythonocc_viewer").setLevel(...); the
+# level check short-circuits before any formatting happens
+logger = logging.getLogger("pythonocc_viewer")
+logger.setLevel(logging.INFO)
+
+_LOG_LEVELS = {
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "SUCCESS": logging.INFO,
+    "INFO": logging.INFO,
+}
+
+
+@lru_cache(maxsize=None)
+def _occ_class(module_name: str, class_name: str):
+    """Resolve an OCC class once; later lookups are a single cache hit"""
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def _read_step(file_path: str):
+    reader = _occ_class('OCC.Core.STEPControl', 'STEPControl_Reader')()
+    if reader.ReadFile(file_path) != 1:
+        return None
+    reader.TransferRoots()
+    return reader.OneShape()
+
+
+def _read_brep(file_path: str):
+    shape = _occ_class('OCC.Core.TopoDS', 'TopoDS_Shape')()
+    breptools = _occ_class('OCC.Core.BRepTools', 'breptools')
+    builder = _occ_class('OCC.Core.BRep', 'BRep_Builder')()
+    if not breptools.Read(shape, file_path, builder):
+        return None
+    return shape
+
+
+def _read_stl(file_path: str):
+    shape = _occ_class('OCC.Core.TopoDS', 'TopoDS_Shape')()
+    if not StlAPI_Reader().Read(shape, file_path):
+        return None
+    return shape
+
+
+def _read_iges(file_path: str):
+    reader = _occ_class('OCC.Core.IGESControl', 'IGESControl_Reader')()
+    if reader.ReadFile(file_path) != 1:
+        return None
+    reader.TransferRoots()
+    return reader.OneShape()
+
+
+# O(1) suffix dispatch for the local CAD fallback readers
+_READERS = {
+    '.step': _read_step, '.stp': _read_step,
+    '.brep': _read_brep,
+    '.stl': _read_stl,
+    '.iges': _read_iges, '.igs': _read_iges,
+}
+
+
 class PythonOCCClient:
     """Professional PythonOCC client for GeometryServer with AIS rendering"""
-    
+
+    # Per-level log color/prefix, resolved with one dict lookup per message
+    _LOG_STYLES = {
+        "ERROR":   ("#ff6666", "[ERROR]"),
+        "WARNING": ("#ffaa00", "[WARN] "),
+        "SUCCESS": ("#66ff66", "[OK]   "),
+        "INFO":    ("#00ff00", "[INFO] "),
+    }
+
+
     def __init__(self):
         self.client = EnhancedGeometryClient(client_id="PythonOCC-AIS")
         self.connected = False
@@ -70,16 +152,31 @@ class PythonOCCClient:
             Quantity_NOC_RED, Quantity_NOC_BLUE, Quantity_NOC_GREEN,
             Quantity_NOC_YELLOW, Quantity_NOC_CYAN, Quantity_NOC_ORANGE
         ]
+        # Pre-wrapped Quantity_Color instances; SWIG construction is not
+        # free, and the palette never changes
+        self._qcolors = [Quantity_Color(c) for c in self.colors]
         self.materials = [
             Graphic3d_NOM_BRASS, Graphic3d_NOM_BRONZE, Graphic3d_NOM_COPPER,
             Graphic3d_NOM_GOLD, Graphic3d_NOM_SILVER, Graphic3d_NOM_PLASTIC
         ]
         self.log_widget = None  # Will hold the log text widget
         self.log_window = None  # Will hold the log window
+        self._log_buffer = deque()  # Pending log lines, flushed in one append
+        self._log_flush_pending = False
+        self._log_ts_cache = (0, "")  # (monotonic second, formatted "%H:%M:%S")
         
     def init_display(self):
         """Initialize PythonOCC display"""
         self.display, self.start_display, self.add_menu, self.add_function = init_display()
+
+        # Route OCCT's parallel algorithms (face meshing with parallel=True,
+        # etc.) through its thread pool; otherwise tessellation of imported
+        # assemblies runs single-threaded
+        try:
+            from OCC.Core.OSD import OSD_Parallel
+            OSD_Parallel.SetUseOcctThreads(True)
+        except Exception:
+            pass  # Older pythonocc builds without the binding
         
         # Set professional background gradient
         self.display.View.SetBgGradientColors(
@@ -145,40 +242,45 @@ class PythonOCCClient:
                 self.log_window.show()
     
     def log(self, message: str, level: str = "INFO"):
-        """Add message to log display"""
+        """Add message to log display (buffered; flushed at ~60 Hz)"""
         if self.log_widget and PYQT5_AVAILABLE:
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            
-            # Color codes for different log levels
-            if level == "ERROR":
-                color = "#ff6666"
-                prefix = "[ERROR]"
-            elif level == "WARNING":
-                color = "#ffaa00"
-                prefix = "[WARN] "
-            elif level == "SUCCESS":
-                color = "#66ff66"
-                prefix = "[OK]   "
-            else:
-                color = "#00ff00"
-                prefix = "[INFO] "
-            
-            # Format and append message with color
-            formatted_message = f'<span style="color: {color}">{timestamp} {prefix} {message}</span>'
-            self.log_widget.append(formatted_message)
-            
-            # Auto-scroll to bottom
-            cursor = self.log_widget.textCursor()
-            cursor.movePosition(QTextCursor.End)
-            self.log_widget.setTextCursor(cursor)
-            
-            # Ensure updates are processed
-            if hasattr(self.log_widget, 'repaint'):
-                self.log_widget.repaint()
-        
-        # Also print to console
-        print(f"[{level}] {message}")
+            # strftime is slow; reformat at most once per second and reuse
+            # the cached string for every message within that second
+            second = int(time.monotonic())
+            if second != self._log_ts_cache[0]:
+                self._log_ts_cache = (second,
+                                      datetime.now().strftime("%H:%M:%S"))
+            timestamp = self._log_ts_cache[1]
+
+            color, prefix = self._LOG_STYLES.get(level, self._LOG_STYLES["INFO"])
+            self._log_buffer.append(
+                f'<span style="color: {color}">{timestamp} {prefix} {message}</span>')
+
+            # Coalesce bursts into one widget append/reflow; Qt schedules
+            # the actual paint, no forced repaint()
+            if not self._log_flush_pending:
+                self._log_flush_pending = True
+                QTimer.singleShot(16, self._flush_log)
+
+        # Also write to console when the level is enabled; sys.stdout.write
+        # skips print's argument handling and per-call flush
+        if logger.isEnabledFor(_LOG_LEVELS.get(level, logging.INFO)):
+            sys.stdout.write(f"[{level}] {message}\n")
+
+    def _flush_log(self):
+        """Append all buffered log lines to the widget in one document edit"""
+        self._log_flush_pending = False
+        if not self._log_buffer or not self.log_widget:
+            return
+
+        html = "<br>".join(self._log_buffer)
+        self._log_buffer.clear()
+        self.log_widget.append(html)
+
+        # Auto-scroll to bottom once per flush
+        cursor = self.log_widget.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        self.log_widget.setTextCursor(cursor)
         
     def connect(self) -> bool:
         """Connect to GeometryServer"""
@@ -197,16 +299,15 @@ class PythonOCCClient:
         # Clear both server and local display
         self.clear_all()
         
-        # Create shapes on server
-        shapes_created = []
-        
-        # Box
-        box_id = self.client.create_box(0, 0, 0, 50, 30, 20)
-        shapes_created.append((box_id, "box", (0, 0, 0), (50, 30, 20)))
-        
-        # Sphere
-        sphere_id = self.client.create_sphere(80, 0, 0, 20)
-        shapes_created.append((sphere_id, "sphere", (80, 0, 0), 20))
+        # Create all shapes on the server in one round trip
+        box_id, sphere_id = self.client.create_shapes_batch([
+            self.client.box_spec(0, 0, 0, 50, 30, 20),
+            self.client.sphere_spec(80, 0, 0, 20),
+        ])
+        shapes_created = [
+            (box_id, "box", (0, 0, 0), (50, 30, 20)),
+            (sphere_id, "sphere", (80, 0, 0), 20),
+        ]
         
         # Create local representations for display
         for i, shape_data in enumerate(shapes_created):
@@ -229,111 +330,139 @@ class PythonOCCClient:
                 ).Shape()
                 
             # Create AIS shape with professional appearance
+            self.mesh_shape_for_display(local_shape)
             ais_shape = AIS_ColoredShape(local_shape)
             
             # Set color and transparency
-            color = Quantity_Color(self.colors[i % len(self.colors)])
+            color = self._qcolors[i % len(self._qcolors)]
             ais_shape.SetColor(color)
             ais_shape.SetTransparency(0.2)
             
-            # Display shape
-            self.display.Context.Display(ais_shape, True)
+            # Display without a per-shape viewer update; one redraw after
+            # the loop
+            self.display.Context.Display(ais_shape, False)
             self.shapes[shape_id] = ais_shape
-            
+
             self.log(f"Created and displayed: {shape_id} ({shape_type})", "SUCCESS")
-            
-        # Fit all in view
+
+        # Fit all in view, one redraw for the whole batch
         self.display.FitAll()
+        self.display.Repaint()
         
     def import_models(self, file_paths: List[str]):
-        """Import and display CAD models"""
+        """Import and display CAD models, overlapping server-side imports"""
         self.log(f"Importing {len(file_paths)} model(s)")
-        
+
+        # Submit every import first - import_model_async returns immediately,
+        # so all files are in flight on the server concurrently - then reap
+        # and display in completion order
+        options = ModelImportOptions(auto_detect_format=True)
+        task_to_file = {}
         for file_path in file_paths:
-            if not os.path.exists(file_path):
+            # One Path parse (and one stat) per file, reused below
+            path = Path(file_path)
+            if not path.is_file():
                 self.log(f"File not found: {file_path}", "ERROR")
                 continue
-                
-            self.log(f"Importing: {Path(file_path).name}")
-            
-            # Import on server
-            task_id = self.client.import_model_async(
-                file_path,
-                ModelImportOptions(auto_detect_format=True)
-            )
-            
-            # Wait for completion
-            try:
-                result = self.client.wait_for_import_completion(task_id, timeout=30.0)
-                if result.success:
-                    self.log(f"Imported {len(result.shape_ids)} shapes on server", "SUCCESS")
-                    
-                    # Also load and display locally for immediate visualization
-                    self.load_and_display_local_file(file_path, result.shape_ids)
-                    
-            except Exception as e:
-                self.log(f"Import failed: {e}", "ERROR")
-    
+            self.log(f"Importing: {path.name}")
+            task_id = self.client.import_model_async(path, options)
+            task_to_file[task_id] = (file_path, path.name)
+
+        if not task_to_file:
+            return
+
+        try:
+            for task_id, future in self.client.wait_any(list(task_to_file),
+                                                        timeout=30.0):
+                file_path, file_name = task_to_file[task_id]
+                try:
+                    result = future.result()
+                    if not result.success:
+                        continue
+                    self.log(f"Imported {len(result.shape_ids)} shapes on server",
+                             "SUCCESS")
+
+                    # Display the server's tessellation directly instead of
+                    # re-parsing the CAD file locally (STEP reads can take
+                    # seconds; the server has already done that work)
+                    try:
+                        self.display_imported_meshes(result.shape_ids, update=False)
+                        self.log(f"Displayed server meshes for {file_name}", "SUCCESS")
+                    except Exception as e:
+                        self.log(f"Mesh fetch failed ({e}), loading locally", "WARNING")
+                        self.load_and_display_local_file(file_path, result.shape_ids)
+                except Exception as e:
+                    self.log(f"Import failed: {e}", "ERROR")
+        except Exception as e:
+            self.log(f"Import batch failed: {e}", "ERROR")
+
+        # One viewer redraw for the whole import batch
+        self.display.FitAll()
+        self.display.Repaint()
+
+    @staticmethod
+    def mesh_shape_for_display(shape):
+        """Tessellate a shape with a bounding-box-scaled deflection
+
+        OCCT would otherwise mesh at its default deflection on first draw,
+        which can badly over- or under-refine. Deflection at 1/1000 of the
+        bbox diagonal gives a predictable LOD, and parallel=True runs the
+        mesher multithreaded.
+        """
+        bbox = Bnd_Box()
+        brepbndlib.Add(shape, bbox)
+        diag = math.sqrt(bbox.SquareExtent()) if not bbox.IsVoid() else 1.0
+        BRepMesh_IncrementalMesh(shape, max(diag, 1e-6) * 1e-3, False, 0.5, True)
+
+    def display_imported_meshes(self, shape_ids: List[str], update: bool = True):
+        """Fetch tessellated meshes for the given shapes and display them
+
+        Pass update=False when batching several calls; the caller then does
+        one FitAll/Repaint at the end.
+        """
+        meshes = self.client.get_meshes(shape_ids)
+        for shape_id, (vertices, normals, indices) in meshes.items():
+            if len(vertices) == 0:
+                continue
+            if len(indices) >= 3:
+                ais = self.build_ais_triangulation(vertices, normals, indices)
+            else:
+                ais = self.build_ais_point_cloud(vertices)
+            self.display.Context.Display(ais, False)
+            self.shapes[shape_id] = ais
+        if update:
+            self.display.FitAll()
+            self.display.Repaint()
+
     def load_and_display_local_file(self, file_path: str, shape_ids: List[str]):
-        """Load a CAD file locally and display it"""
+        """Load a CAD file locally and display it (offline fallback)"""
         try:
-            file_ext = Path(file_path).suffix.lower()
-            shape = None
-            
-            if file_ext in ['.step', '.stp']:
-                # Read STEP file
-                from OCC.Core.STEPControl import STEPControl_Reader
-                reader = STEPControl_Reader()
-                status = reader.ReadFile(file_path)
-                if status == 1:  # Success
-                    reader.TransferRoots()
-                    shape = reader.OneShape()
-                    
-            elif file_ext == '.brep':
-                # Read BREP file
-                from OCC.Core.BRepTools import breptools
-                from OCC.Core.TopoDS import TopoDS_Shape
-                from OCC.Core.BRep import BRep_Builder
-                shape = TopoDS_Shape()
-                builder = BRep_Builder()
-                success = breptools.Read(shape, file_path, builder)
-                if not success:
-                    self.log(f"Failed to read BREP file: {file_path}", "ERROR")
-                    return
-                    
-            elif file_ext == '.stl':
-                # Read STL file
-                from OCC.Core.StlAPI import StlAPI_Reader
-                reader = StlAPI_Reader()
-                shape = TopoDS_Shape()
-                if not reader.Read(shape, file_path):
-                    self.log(f"Failed to read STL file: {file_path}", "ERROR")
-                    return
-                    
-            elif file_ext in ['.iges', '.igs']:
-                # Read IGES file
-                from OCC.Core.IGESControl import IGESControl_Reader
-                reader = IGESControl_Reader()
-                status = reader.ReadFile(file_path)
-                if status == 1:  # Success
-                    reader.TransferRoots()
-                    shape = reader.OneShape()
-            
+            # Parse the path once; suffix and name are reused below
+            path = Path(file_path)
+            file_ext = path.suffix.lower()
+
+            reader_fn = _READERS.get(file_ext)
+            shape = reader_fn(file_path) if reader_fn else None
+            if reader_fn and shape is None:
+                self.log(f"Failed to read {file_ext} file: {file_path}", "ERROR")
+                return
+
             if shape:
                 # Create AIS shape and display
-                color_idx = len(self.shapes) % len(self.colors)
+                self.mesh_shape_for_display(shape)
+                color_idx = len(self.shapes) % len(self._qcolors)
                 ais_shape = AIS_ColoredShape(shape)
-                ais_shape.SetColor(Quantity_Color(self.colors[color_idx]))
+                ais_shape.SetColor(self._qcolors[color_idx])
                 ais_shape.SetTransparency(0.1)
                 
-                # Display the shape
-                self.display.Context.Display(ais_shape, True)
+                # Display the shape; redraw happens in the FitAll below
+                self.display.Context.Display(ais_shape, False)
                 
                 # Store it with the server shape ID
                 if shape_ids:
                     self.shapes[shape_ids[0]] = ais_shape
                     
-                self.log(f"Displayed locally: {Path(file_path).name}", "SUCCESS")
+                self.log(f"Displayed locally: {path.name}", "SUCCESS")
                 self.display.FitAll()
                 
         except Exception as e:
@@ -342,27 +471,81 @@ class PythonOCCClient:
             self.display_server_meshes()
                 
     def display_server_meshes(self):
-        """Fetch and display meshes from server as points"""
+        """Fetch and display meshes from server as shaded triangulations"""
         self.log("Displaying Server Meshes")
-        
-        meshes = self.client.get_all_meshes()
-        self.log(f"Received {len(meshes)} meshes from server")
-        
-        for i, mesh_data in enumerate(meshes):
+
+        # Consume the server stream progressively: each mesh is decoded
+        # (zero-copy frombuffer views) and displayed while later meshes
+        # are still on the wire
+        mesh_count = 0
+        for mesh_data in self.client.iter_all_meshes():
+            mesh_count += 1
             shape_id = mesh_data['shape_id']
             vertices = mesh_data['vertices']
-            
-            if len(vertices) > 0:
-                # Create point cloud for visualization
-                # (In production, you'd create proper triangulated shape)
-                for vertex in vertices[::10]:  # Sample every 10th vertex
-                    point = BRepBuilderAPI_MakeVertex(
-                        gp_Pnt(vertex[0], vertex[1], vertex[2])
-                    ).Shape()
-                    self.display.DisplayShape(point, update=False)
-                    
+            indices = mesh_data['indices']
+
+            if len(vertices) == 0:
+                continue
+
+            if len(indices) >= 3:
+                ais = self.build_ais_triangulation(
+                    vertices, mesh_data['normals'], indices)
+            else:
+                # No connectivity available - fall back to a point cloud
+                ais = self.build_ais_point_cloud(vertices)
+            self.display.Context.Display(ais, False)
+
+        self.log(f"Received {mesh_count} meshes from server")
         self.display.FitAll()
         self.display.Repaint()
+
+    @staticmethod
+    def build_ais_triangulation(vertices, normals, indices):
+        """Build an indexed AIS_Triangulation from decoded mesh arrays
+
+        Server vertices are already shared (they come from the server's
+        Poly_Triangulation nodes), so the index buffer is reused as-is
+        instead of re-deduplicating the positions client-side.
+        """
+        n_verts = len(vertices)
+        n_tris = len(indices) // 3
+
+        # gp_Dir rejects zero vectors; give degenerate normals a safe default
+        lengths = np.linalg.norm(normals, axis=1)
+        safe_normals = np.where(lengths[:, None] > 1e-6, normals,
+                                np.array([0.0, 0.0, 1.0], np.float32))
+
+        triangulation = Poly_Triangulation(n_verts, n_tris, False, True)
+        for j in range(n_verts):
+            triangulation.SetNode(j + 1, gp_Pnt(float(vertices[j, 0]),
+                                                float(vertices[j, 1]),
+                                                float(vertices[j, 2])))
+            triangulation.SetNormal(j + 1, gp_Dir(float(safe_normals[j, 0]),
+                                                  float(safe_normals[j, 1]),
+                                                  float(safe_normals[j, 2])))
+        for k in range(n_tris):
+            triangulation.SetTriangle(k + 1, Poly_Triangle(
+                int(indices[3 * k]) + 1,
+                int(indices[3 * k + 1]) + 1,
+                int(indices[3 * k + 2]) + 1))
+        return AIS_Triangulation(triangulation)
+
+    @staticmethod
+    def build_ais_point_cloud(vertices):
+        """Build an AIS_PointCloud from a (sub-sampled) vertex array
+
+        tolist() converts the whole slice to plain floats in one C pass,
+        and the hoisted bound method keeps the remaining per-point work to
+        a single AddVertex call into OCCT.
+        """
+        sampled = np.ascontiguousarray(vertices[::10], dtype=np.float32)
+        points = Graphic3d_ArrayOfPoints(len(sampled))
+        add_vertex = points.AddVertex
+        for x, y, z in sampled.tolist():
+            add_vertex(x, y, z)
+        point_cloud = AIS_PointCloud()
+        point_cloud.SetPoints(points)
+        return point_cloud
         
     def clear_all(self):
         """Clear both server and local display"""
@@ -374,26 +557,31 @@ class PythonOCCClient:
         self.shapes.clear()
         self.log("Cleared server and local display", "SUCCESS")
     
+    # Constant dialog filter list, built once
+    _FILETYPES = (
+        ("All CAD Files", "*.step;*.stp;*.brep;*.iges;*.igs;*.stl"),
+        ("STEP Files", "*.step;*.stp"),
+        ("BREP Files", "*.brep"),
+        ("IGES Files", "*.iges;*.igs"),
+        ("STL Files", "*.stl"),
+        ("All Files", "*.*")
+    )
+    # Hidden Tk root shared by all dialog opens; tk.Tk() boots a full Tcl
+    # interpreter, so pay that once instead of per dialog
+    _TK_ROOT = None
+
     def import_models_dialog(self):
         """Open file dialog to import models (supports multiple selection)"""
-        # Create a hidden root window for the dialog
-        root = tk.Tk()
-        root.withdraw()
-        
+        if PythonOCCClient._TK_ROOT is None:
+            PythonOCCClient._TK_ROOT = tk.Tk()
+            PythonOCCClient._TK_ROOT.withdraw()
+
         file_paths = filedialog.askopenfilenames(
+            parent=PythonOCCClient._TK_ROOT,
             title="Select CAD Models",
-            filetypes=[
-                ("All CAD Files", "*.step;*.stp;*.brep;*.iges;*.igs;*.stl"),
-                ("STEP Files", "*.step;*.stp"),
-                ("BREP Files", "*.brep"),
-                ("IGES Files", "*.iges;*.igs"),
-                ("STL Files", "*.stl"),
-                ("All Files", "*.*")
-            ]
+            filetypes=self._FILETYPES
         )
-        
-        root.destroy()
-        
+
         if file_paths:
             self.import_models(list(file_paths))
         
@@ -14,14 +14,20 @@ import geometry_service_pb2
 import geometry_service_pb2_grpc
 
 
-def create_client(client_id):
-    """Create a gRPC client with a specific client ID."""
-    channel = grpc.insecure_channel('localhost:50051')
+def create_client(client_id, channel=None):
+    """Create a gRPC client with a specific client ID.
+
+    Pass a shared channel to multiplex several logical clients over one
+    HTTP/2 connection; sessions are distinguished by metadata only.
+    """
+    if channel is None:
+        channel = grpc.insecure_channel('localhost:50051',
+                                        options=[('grpc.enable_http_proxy', 0)])
     stub = geometry_service_pb2_grpc.GeometryServiceStub(channel)
-    
+
     # Create metadata with client ID
     metadata = [('client-id', client_id)]
-    
+
     return channel, stub, metadata
 
 
@@ -31,9 +37,10 @@ def test_session_isolation():
     print("Testing Client Session Isolation")
     print("=" * 60)
     
-    # Create two different clients
-    channel1, stub1, metadata1 = create_client('Client-A')
-    channel2, stub2, metadata2 = create_client('Client-B')
+    # Create two different clients sharing one HTTP/2 connection; session
+    # isolation comes from the client-id metadata, not the channel
+    channel, stub1, metadata1 = create_client('Client-A')
+    _, stub2, metadata2 = create_client('Client-B', channel=channel)
     
     try:
         # Step 1: Client A creates a box
@@ -70,31 +77,33 @@ def test_session_isolation():
         client_b_shape = sphere_response.shape_id
         print(f"   Created: {client_b_shape}")
         
-        # Step 3: Check Client A's shapes count
+        # Steps 3+4: Check both clients' shape counts. The .future() calls
+        # start both RPCs immediately, so the two round-trips overlap on the
+        # shared HTTP/2 connection instead of running back to back.
         print("\n3. Checking Client-A's shape count...")
         info_request = geometry_service_pb2.EmptyRequest()
-        info_response = stub1.GetSystemInfo(info_request, metadata=metadata1)
-        print(f"   Client-A has {info_response.active_shapes} shapes (expected: 1)")
-        
+        info_future_a = stub1.GetSystemInfo.future(info_request, metadata=metadata1)
+        info_future_b = stub2.GetSystemInfo.future(info_request, metadata=metadata2)
+        print(f"   Client-A has {info_future_a.result().active_shapes} shapes (expected: 1)")
+
         # Step 4: Check Client B's shapes count
         print("\n4. Checking Client-B's shape count...")
-        info_response = stub2.GetSystemInfo(info_request, metadata=metadata2)
-        print(f"   Client-B has {info_response.active_shapes} shapes (expected: 1)")
+        print(f"   Client-B has {info_future_b.result().active_shapes} shapes (expected: 1)")
         
         # Step 5: Client B clears all shapes
         print("\n5. Client-B clears all shapes...")
         clear_response = stub2.ClearAll(info_request, metadata=metadata2)
         print(f"   {clear_response.message}")
         
-        # Step 6: Verify Client A still has its shape
+        # Steps 6+7: Verify both clients concurrently
         print("\n6. Verifying Client-A still has its shape...")
-        info_response = stub1.GetSystemInfo(info_request, metadata=metadata1)
-        print(f"   Client-A has {info_response.active_shapes} shapes (expected: 1)")
-        
+        info_future_a = stub1.GetSystemInfo.future(info_request, metadata=metadata1)
+        info_future_b = stub2.GetSystemInfo.future(info_request, metadata=metadata2)
+        print(f"   Client-A has {info_future_a.result().active_shapes} shapes (expected: 1)")
+
         # Step 7: Verify Client B has no shapes
         print("\n7. Verifying Client-B has no shapes...")
-        info_response = stub2.GetSystemInfo(info_request, metadata=metadata2)
-        print(f"   Client-B has {info_response.active_shapes} shapes (expected: 0)")
+        print(f"   Client-B has {info_future_b.result().active_shapes} shapes (expected: 0)")
         
         # Step 8: Client A tries to delete Client B's shape (should fail)
         print("\n8. Client-A tries to delete Client-B's shape (should fail)...")
@@ -105,31 +114,33 @@ def test_session_isolation():
         print(f"   Success: {delete_response.success} (expected: False)")
         
         # Step 9: Create multiple shapes for stress test
+        # One CreateShapesBatch round-trip per client instead of 3 unary RPCs
         print("\n9. Creating multiple shapes for both clients...")
-        for i in range(3):
-            # Client A creates boxes
-            box_response = stub1.CreateBox(box_request, metadata=metadata1)
-            print(f"   Client-A created: {box_response.shape_id}")
-            
-            # Client B creates spheres
-            sphere_response = stub2.CreateSphere(sphere_request, metadata=metadata2)
-            print(f"   Client-B created: {sphere_response.shape_id}")
+        box_batch = geometry_service_pb2.BatchCreateRequest(
+            specs=[geometry_service_pb2.ShapeSpec(box=box_request)] * 3)
+        sphere_batch = geometry_service_pb2.BatchCreateRequest(
+            specs=[geometry_service_pb2.ShapeSpec(sphere=sphere_request)] * 3)
+        # Pipeline both batches; they run in flight together
+        batch_future_a = stub1.CreateShapesBatch.future(box_batch, metadata=metadata1)
+        batch_future_b = stub2.CreateShapesBatch.future(sphere_batch, metadata=metadata2)
+        for shape_response in batch_future_a.result().responses:
+            print(f"   Client-A created: {shape_response.shape_id}")
+        for shape_response in batch_future_b.result().responses:
+            print(f"   Client-B created: {shape_response.shape_id}")
         
-        # Step 10: Final shape count
+        # Step 10: Final shape count (both queries in flight together)
         print("\n10. Final shape counts:")
-        info_response = stub1.GetSystemInfo(info_request, metadata=metadata1)
-        print(f"   Client-A has {info_response.active_shapes} shapes (expected: 4)")
-        
-        info_response = stub2.GetSystemInfo(info_request, metadata=metadata2)
-        print(f"   Client-B has {info_response.active_shapes} shapes (expected: 3)")
+        info_future_a = stub1.GetSystemInfo.future(info_request, metadata=metadata1)
+        info_future_b = stub2.GetSystemInfo.future(info_request, metadata=metadata2)
+        print(f"   Client-A has {info_future_a.result().active_shapes} shapes (expected: 4)")
+        print(f"   Client-B has {info_future_b.result().active_shapes} shapes (expected: 3)")
         
         print("\n" + "=" * 60)
         print("Session Isolation Test: COMPLETED")
         print("=" * 60)
         
     finally:
-        channel1.close()
-        channel2.close()
+        channel.close()
 
 
 if __name__ == '__main__':
@@ -2,6 +2,7 @@
 #include "../../common/grpc_performance_monitor.h"
 #include <spdlog/spdlog.h>
 #include <chrono>
+#include <cstring>
 
 GeometryClient::GeometryClient(const std::string& server_address, const std::string& client_id) 
     : server_address_(server_address), client_id_(client_id), connected_(false) {
@@ -439,9 +440,9 @@ std::vector<GeometryClient::MeshData> GeometryClient::GetAllMeshes() {
         geometry::MeshData proto_mesh;
         while (reader->Read(&proto_mesh)) {
             // Calculate approximate bytes received for this mesh
-            size_t mesh_bytes = proto_mesh.vertices_size() * sizeof(float) + 
-                               proto_mesh.indices_size() * sizeof(int32_t) + 
-                               proto_mesh.normals_size() * sizeof(float) +
+            size_t mesh_bytes = proto_mesh.vertices_raw().size() +
+                               proto_mesh.normals_q16().size() +
+                               proto_mesh.indices_raw().size() +
                                proto_mesh.shape_id().size() + 16; // overhead
             total_bytes_received += mesh_bytes;
             
@@ -511,28 +512,32 @@ GeometryClient::MeshData GeometryClient::ConvertProtoMesh(const geometry::MeshDa
     MeshData mesh_data;
     mesh_data.shape_id = proto_mesh.shape_id();
     
-    // Convert vertices
-    mesh_data.vertices.reserve(proto_mesh.vertices_size() * 3);
-    for (const auto& vertex : proto_mesh.vertices()) {
-        mesh_data.vertices.push_back(static_cast<float>(vertex.x()));
-        mesh_data.vertices.push_back(static_cast<float>(vertex.y()));
-        mesh_data.vertices.push_back(static_cast<float>(vertex.z()));
-    }
-    
-    // Convert normals
-    mesh_data.normals.reserve(proto_mesh.normals_size() * 3);
-    for (const auto& normal : proto_mesh.normals()) {
-        mesh_data.normals.push_back(static_cast<float>(normal.x()));
-        mesh_data.normals.push_back(static_cast<float>(normal.y()));
-        mesh_data.normals.push_back(static_cast<float>(normal.z()));
+    // Decode packed little-endian buffers written by the server:
+    // float32 vertices, int16 quantized normals, uint32 indices
+    const std::string& vertices_raw = proto_mesh.vertices_raw();
+    mesh_data.vertices.resize(vertices_raw.size() / sizeof(float));
+    std::memcpy(mesh_data.vertices.data(), vertices_raw.data(),
+                mesh_data.vertices.size() * sizeof(float));
+
+    // Dequantize normals (quantized by 32767 on the wire)
+    const std::string& normals_q16 = proto_mesh.normals_q16();
+    const int16_t* normal_in = reinterpret_cast<const int16_t*>(normals_q16.data());
+    size_t normal_count = normals_q16.size() / sizeof(int16_t);
+    mesh_data.normals.resize(normal_count);
+    constexpr float normal_scale = 1.0f / 32767.0f;
+    for (size_t i = 0; i < normal_count; i++) {
+        mesh_data.normals[i] = static_cast<float>(normal_in[i]) * normal_scale;
     }
-    
+
     // Convert indices
-    mesh_data.indices.reserve(proto_mesh.indices_size());
-    for (int index : proto_mesh.indices()) {
-        mesh_data.indices.push_back(index);
+    const std::string& indices_raw = proto_mesh.indices_raw();
+    const uint32_t* index_in = reinterpret_cast<const uint32_t*>(indices_raw.data());
+    size_t index_count = indices_raw.size() / sizeof(uint32_t);
+    mesh_data.indices.resize(index_count);
+    for (size_t i = 0; i < index_count; i++) {
+        mesh_data.indices[i] = static_cast<int>(index_in[i]);
     }
-    
+
     // Convert color
     if (proto_mesh.has_color()) {
         const auto& color = proto_mesh.color();
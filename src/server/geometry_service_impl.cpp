@@ -452,6 +452,85 @@ grpc::Status GeometryServiceImpl::CreateCylinder(grpc::ServerContext* context,
     }
 }
 
+grpc::Status GeometryServiceImpl::CreateShapesBatch(grpc::ServerContext* context,
+                                                   const geometry::BatchCreateRequest* request,
+                                                   geometry::BatchCreateResponse* response) {
+    try {
+        std::string client_id = getClientId(context);
+        spdlog::info("[{}] CreateShapesBatch: {} specs", client_id, request->specs_size());
+
+        // Get or create session for this client
+        auto session = getOrCreateSession(client_id);
+
+        bool all_succeeded = true;
+        for (const auto& spec : request->specs()) {
+            auto* shape_response = response->add_responses();
+
+            Handle(AIS_Shape) ais_shape;
+            geometry::Color color;
+            switch (spec.spec_case()) {
+                case geometry::ShapeSpec::kBox:
+                    ais_shape = createBoxShape(spec.box());
+                    color = spec.box().color();
+                    break;
+                case geometry::ShapeSpec::kCone:
+                    ais_shape = createConeShape(spec.cone());
+                    color = spec.cone().color();
+                    break;
+                case geometry::ShapeSpec::kSphere:
+                    ais_shape = createSphereShape(spec.sphere());
+                    color = spec.sphere().color();
+                    break;
+                case geometry::ShapeSpec::kCylinder:
+                    ais_shape = createCylinderShape(spec.cylinder());
+                    color = spec.cylinder().color();
+                    break;
+                default:
+                    shape_response->set_success(false);
+                    shape_response->set_message("Empty shape spec");
+                    all_succeeded = false;
+                    continue;
+            }
+
+            if (ais_shape.IsNull()) {
+                shape_response->set_success(false);
+                shape_response->set_message("Failed to create shape");
+                all_succeeded = false;
+                continue;
+            }
+
+            std::string shape_id = session->generateShapeId();
+
+            // Store shape data in session
+            ShapeData shape_data;
+            shape_data.ais_shape = ais_shape;
+            shape_data.topo_shape = ais_shape->Shape();
+            shape_data.color = color;
+            shape_data.shape_id = shape_id;
+
+            session->shapes[shape_id] = std::move(shape_data);
+
+            shape_response->set_shape_id(shape_id);
+            shape_response->set_success(true);
+            shape_response->set_message("Shape created successfully");
+        }
+
+        response->set_success(all_succeeded);
+        response->set_message(all_succeeded ? "Batch created successfully"
+                                            : "Batch completed with failures");
+
+        spdlog::info("[{}] CreateShapesBatch: Created {} shapes (session has {} shapes)",
+                    client_id, response->responses_size(), session->shapes.size());
+        return grpc::Status::OK;
+
+    } catch (const std::exception& e) {
+        spdlog::error("CreateShapesBatch: Exception occurred: {}", e.what());
+        response->set_success(false);
+        response->set_message("Internal server error: " + std::string(e.what()));
+        return grpc::Status::OK;
+    }
+}
+
 grpc::Status GeometryServiceImpl::DeleteShape(grpc::ServerContext* context,
                                              const geometry::ShapeRequest* request,
                                              geometry::StatusResponse* response) {
@@ -510,8 +589,9 @@ grpc::Status GeometryServiceImpl::GetMeshData(grpc::ServerContext* context,
     try {
         spdlog::info("[{}] GetMeshData: Extracting mesh for shape: {}", client_id, shape_id);
         *response = extractMeshData(shape_id);
-        spdlog::info("[{}] GetMeshData: Successfully extracted mesh with {} vertices, {} indices", client_id, 
-                    response->vertices_size(), response->indices_size());
+        spdlog::info("[{}] GetMeshData: Successfully extracted mesh with {} vertices, {} indices", client_id,
+                    response->vertices_raw().size() / (3 * sizeof(float)),
+                    response->indices_raw().size() / sizeof(uint32_t));
         return grpc::Status::OK;
         
     } catch (const std::exception& e) {
@@ -520,13 +600,49 @@ grpc::Status GeometryServiceImpl::GetMeshData(grpc::ServerContext* context,
     }
 }
 
+grpc::Status GeometryServiceImpl::GetMeshDataBatch(grpc::ServerContext* context,
+                                                  const geometry::ShapeIdList* request,
+                                                  grpc::ServerWriter<geometry::MeshData>* writer) {
+    try {
+        // Mesh buffers are large and compress well; gzip the response stream
+        context->set_compression_algorithm(GRPC_COMPRESS_GZIP);
+
+        std::string client_id = getClientId(context);
+        auto session = getOrCreateSession(client_id);
+
+        spdlog::info("[{}] GetMeshDataBatch: Streaming {} requested shapes", client_id,
+                    request->shape_ids_size());
+
+        for (const auto& shape_id : request->shape_ids()) {
+            if (session->shapes.find(shape_id) == session->shapes.end()) {
+                spdlog::warn("[{}] GetMeshDataBatch: Shape not found in session: {}", client_id, shape_id);
+                continue;
+            }
+            geometry::MeshData mesh_data = extractMeshData(shape_id);
+            if (!writer->Write(mesh_data)) {
+                spdlog::error("GetMeshDataBatch: Failed to write mesh data for shape: {}", shape_id);
+                break;
+            }
+        }
+
+        return grpc::Status::OK;
+
+    } catch (const std::exception& e) {
+        spdlog::error("GetMeshDataBatch: Exception occurred: {}", e.what());
+        return grpc::Status(grpc::StatusCode::INTERNAL, "Failed to stream mesh data: " + std::string(e.what()));
+    }
+}
+
 grpc::Status GeometryServiceImpl::GetAllMeshes(grpc::ServerContext* context,
                                               const geometry::EmptyRequest* request,
                                               grpc::ServerWriter<geometry::MeshData>* writer) {
     try {
+        // Mesh buffers are large and compress well; gzip the response stream
+        context->set_compression_algorithm(GRPC_COMPRESS_GZIP);
+
         std::string client_id = getClientId(context);
         auto session = getOrCreateSession(client_id);
-        
+
         spdlog::info("[{}] GetAllMeshes: Streaming {} shapes from client session", client_id, session->shapes.size());
         
         for (const auto& [shape_id, shape_data] : session->shapes) {
@@ -535,8 +651,8 @@ grpc::Status GeometryServiceImpl::GetAllMeshes(grpc::ServerContext* context,
                 spdlog::error("GetAllMeshes: Failed to write mesh data for shape: {}", shape_id);
                 break;
             }
-            spdlog::info("[{}] GetAllMeshes: Sent mesh for shape: {} ({} vertices)", client_id, 
-                        shape_id, mesh_data.vertices_size());
+            spdlog::info("[{}] GetAllMeshes: Sent mesh for shape: {} ({} vertices)", client_id,
+                        shape_id, mesh_data.vertices_raw().size() / (3 * sizeof(float)));
         }
         
         spdlog::info("[{}] GetAllMeshes: Completed streaming all meshes for session", client_id);
@@ -752,25 +868,48 @@ geometry::MeshData GeometryServiceImpl::extractMeshData(const std::string& shape
         }
     }
     
-    // Convert to protobuf format
-    for (const gp_Pnt& vertex : vertices) {
-        geometry::Point3D* proto_vertex = mesh_data.add_vertices();
-        proto_vertex->set_x(vertex.X());
-        proto_vertex->set_y(vertex.Y());
-        proto_vertex->set_z(vertex.Z());
-    }
-    
-    for (const gp_Vec& normal : normals) {
-        geometry::Vector3D* proto_normal = mesh_data.add_normals();
-        proto_normal->set_x(normal.X());
-        proto_normal->set_y(normal.Y());
-        proto_normal->set_z(normal.Z());
-    }
-    
-    for (int index : indices) {
-        mesh_data.add_indices(index);
+    // Declare counts up front so receivers can size their buffers exactly
+    mesh_data.set_vertex_count(static_cast<uint32_t>(vertices.size()));
+    mesh_data.set_triangle_count(static_cast<uint32_t>(indices.size() / 3));
+
+    // Pack flat binary buffers (float32/uint32, little-endian). Consumers
+    // reinterpret these directly without per-vertex protobuf decoding.
+    {
+        std::string* vertices_raw = mesh_data.mutable_vertices_raw();
+        vertices_raw->resize(vertices.size() * 3 * sizeof(float));
+        float* vertex_out = reinterpret_cast<float*>(vertices_raw->data());
+        for (const gp_Pnt& vertex : vertices) {
+            *vertex_out++ = static_cast<float>(vertex.X());
+            *vertex_out++ = static_cast<float>(vertex.Y());
+            *vertex_out++ = static_cast<float>(vertex.Z());
+        }
+
+        // Normals are unit vectors, so int16 quantization (value * 32767)
+        // halves the payload versus float32 with no visible quality loss.
+        // GL consumers can bind this directly as normalized GL_SHORT.
+        auto quantize_normal = [](double value) -> int16_t {
+            double scaled = value * 32767.0;
+            if (scaled > 32767.0) scaled = 32767.0;
+            if (scaled < -32767.0) scaled = -32767.0;
+            return static_cast<int16_t>(scaled);
+        };
+        std::string* normals_q16 = mesh_data.mutable_normals_q16();
+        normals_q16->resize(normals.size() * 3 * sizeof(int16_t));
+        int16_t* normal_out = reinterpret_cast<int16_t*>(normals_q16->data());
+        for (const gp_Vec& normal : normals) {
+            *normal_out++ = quantize_normal(normal.X());
+            *normal_out++ = quantize_normal(normal.Y());
+            *normal_out++ = quantize_normal(normal.Z());
+        }
+
+        std::string* indices_raw = mesh_data.mutable_indices_raw();
+        indices_raw->resize(indices.size() * sizeof(uint32_t));
+        uint32_t* index_out = reinterpret_cast<uint32_t*>(indices_raw->data());
+        for (int index : indices) {
+            *index_out++ = static_cast<uint32_t>(index);
+        }
     }
-    
+
     // Set color from our thread-safe copy
     mesh_data.mutable_color()->CopyFrom(shape_data_copy.color);
     
@@ -846,41 +985,8 @@ grpc::Status GeometryServiceImpl::ImportModelFile(grpc::ServerContext* context,
             request->file_path(), request->options());
         
         // Move shapes from global to session with rollback capability
-        std::vector<std::string> session_shape_ids;
-        std::vector<std::pair<std::string, ShapeData>> backup_shapes;
-        
-        try {
-            for (const auto& shape_id : shape_ids) {
-                auto it = shapes_.find(shape_id);
-                if (it != shapes_.end()) {
-                    // Generate new session-specific ID
-                    std::string new_shape_id = session->generateShapeId();
-                    
-                    // Back up the original shape for rollback
-                    backup_shapes.emplace_back(shape_id, it->second);
-                    
-                    // Move to session
-                    ShapeData shape_data = std::move(it->second);
-                    shape_data.shape_id = new_shape_id;
-                    session->shapes[new_shape_id] = std::move(shape_data);
-                    shapes_.erase(it);
-                    
-                    session_shape_ids.push_back(new_shape_id);
-                }
-            }
-            shape_ids = std::move(session_shape_ids);  // Use session IDs
-        } catch (...) {
-            // Rollback: restore backed up shapes
-            for (const auto& [orig_id, shape_data] : backup_shapes) {
-                shapes_[orig_id] = shape_data;
-            }
-            // Remove any partially added shapes from session
-            for (const auto& session_id : session_shape_ids) {
-                session->shapes.erase(session_id);
-            }
-            throw;  // Re-throw original exception
-        }
-        
+        shape_ids = moveShapesToSession(session, shape_ids);
+
         response->set_success(true);
         response->set_message("Model file imported successfully");
         
@@ -909,13 +1015,173 @@ grpc::Status GeometryServiceImpl::ImportModelFile(grpc::ServerContext* context,
 }
 
 
+grpc::Status GeometryServiceImpl::ImportModelFileProgress(grpc::ServerContext* context,
+                                                         const geometry::ModelFileRequest* request,
+                                                         grpc::ServerWriter<geometry::ImportProgress>* writer) {
+    std::string client_id = getClientId(context);
+    spdlog::info("[{}] ImportModelFileProgress: Importing file: {}", client_id, request->file_path());
+
+    // Get or create session for this client
+    auto session = getOrCreateSession(client_id);
+
+    auto write_progress = [writer](float progress, const std::string& stage) {
+        geometry::ImportProgress update;
+        update.set_progress(progress);
+        update.set_stage(stage);
+        writer->Write(update);
+    };
+
+    geometry::ImportProgress final_update;
+    final_update.set_done(true);
+    final_update.set_progress(1.0f);
+    auto* response = final_update.mutable_result();
+
+    try {
+        write_progress(0.1f, "Detecting format");
+        std::string detected_format = detectFileFormat(request->file_path(), request->options().force_format());
+
+        write_progress(0.3f, "Reading " + detected_format + " file");
+        std::vector<std::string> shape_ids = importModelFileInternal(
+            request->file_path(), request->options());
+
+        write_progress(0.8f, "Registering shapes");
+        shape_ids = moveShapesToSession(session, shape_ids);
+
+        response->set_success(true);
+        response->set_message("Model file imported successfully");
+        for (const auto& shape_id : shape_ids) {
+            response->add_shape_ids(shape_id);
+        }
+        response->set_detected_format(detected_format);
+
+        geometry::ModelFileInfo file_info = getModelFileInfo(
+            request->file_path(), "", shape_ids.size(), detected_format);
+        response->mutable_file_info()->CopyFrom(file_info);
+
+        final_update.set_stage("Import completed");
+        spdlog::info("[{}] ImportModelFileProgress: Successfully imported {} shapes from {} (format: {}, session has {} total shapes)",
+                    client_id, shape_ids.size(), request->file_path(), detected_format, session->shapes.size());
+
+    } catch (const std::exception& e) {
+        response->set_success(false);
+        response->set_message(std::string("Failed to import model file: ") + e.what());
+        final_update.set_stage("Import failed");
+        spdlog::error("ImportModelFileProgress: Exception: {}", e.what());
+    }
+
+    writer->Write(final_update);
+    return grpc::Status::OK;
+}
+
+std::vector<std::string> GeometryServiceImpl::moveShapesToSession(
+    const std::shared_ptr<ClientSession>& session, const std::vector<std::string>& shape_ids) {
+    // Move imported shapes from the deprecated global map into the client
+    // session, generating session-specific IDs and rolling back on failure
+    std::vector<std::string> session_shape_ids;
+    std::vector<std::pair<std::string, ShapeData>> backup_shapes;
+
+    try {
+        for (const auto& shape_id : shape_ids) {
+            auto it = shapes_.find(shape_id);
+            if (it != shapes_.end()) {
+                // Generate new session-specific ID
+                std::string new_shape_id = session->generateShapeId();
+
+                // Back up the original shape for rollback
+                backup_shapes.emplace_back(shape_id, it->second);
+
+                // Move to session
+                ShapeData shape_data = std::move(it->second);
+                shape_data.shape_id = new_shape_id;
+                session->shapes[new_shape_id] = std::move(shape_data);
+                shapes_.erase(it);
+
+                session_shape_ids.push_back(new_shape_id);
+            }
+        }
+    } catch (...) {
+        // Rollback: restore backed up shapes
+        for (const auto& [orig_id, shape_data] : backup_shapes) {
+            shapes_[orig_id] = shape_data;
+        }
+        // Remove any partially added shapes from session
+        for (const auto& session_id : session_shape_ids) {
+            session->shapes.erase(session_id);
+        }
+        throw;  // Re-throw original exception
+    }
+
+    return session_shape_ids;
+}
+
+grpc::Status GeometryServiceImpl::ImportModelStream(grpc::ServerContext* context,
+                                                   grpc::ServerReader<geometry::ModelChunk>* reader,
+                                                   geometry::ModelImportResponse* response) {
+    std::string client_id = getClientId(context);
+    auto session = getOrCreateSession(client_id);
+
+    try {
+        geometry::ModelChunk chunk;
+        geometry::ModelImportOptions options;
+        std::string filename;
+        std::string model_data;
+        bool first_chunk = true;
+
+        while (reader->Read(&chunk)) {
+            if (first_chunk) {
+                filename = chunk.filename();
+                options = chunk.options();
+                first_chunk = false;
+                spdlog::info("[{}] ImportModelStream: Receiving upload: {}", client_id, filename);
+            }
+            model_data.append(chunk.data());
+        }
+
+        if (filename.empty() || model_data.empty()) {
+            response->set_success(false);
+            response->set_message("Empty upload: no filename or data received");
+            return grpc::Status::OK;
+        }
+
+        std::vector<std::string> shape_ids = importModelDataInternal(model_data, filename, options);
+        shape_ids = moveShapesToSession(session, shape_ids);
+
+        response->set_success(true);
+        response->set_message("Model data imported successfully");
+
+        for (const auto& shape_id : shape_ids) {
+            response->add_shape_ids(shape_id);
+        }
+
+        std::string detected_format = detectFileFormat(filename, options.force_format());
+        response->set_detected_format(detected_format);
+
+        geometry::ModelFileInfo file_info = getModelFileInfo(
+            filename, model_data, shape_ids.size(), detected_format);
+        response->mutable_file_info()->CopyFrom(file_info);
+
+        spdlog::info("[{}] ImportModelStream: Imported {} shapes from {} bytes of {} (format: {}, session has {} total shapes)",
+                    client_id, shape_ids.size(), model_data.size(), filename, detected_format, session->shapes.size());
+
+    } catch (const std::exception& e) {
+        response->set_success(false);
+        response->set_message(std::string("Failed to import model data: ") + e.what());
+        spdlog::error("ImportModelStream: Exception: {}", e.what());
+    }
+
+    return grpc::Status::OK;
+}
+
 grpc::Status GeometryServiceImpl::ExportModelFile(grpc::ServerContext* context,
                                                  const geometry::ModelExportRequest* request,
                                                  geometry::ModelFileResponse* response) {
+    // Exported model text (STEP/BREP) compresses well; gzip the response
+    context->set_compression_algorithm(GRPC_COMPRESS_GZIP);
+
     std::string client_id = getClientId(context);
     auto session = getOrCreateSession(client_id);
-    
-    spdlog::info("[{}] ExportModelFile: Exporting {} shapes to format: {}", client_id, 
+
+    spdlog::info("[{}] ExportModelFile: Exporting {} shapes to format: {}", client_id,
                 request->shape_ids_size(), request->options().format());
     
     try {
@@ -48,6 +48,10 @@ public:
                                const geometry::CylinderRequest* request,
                                geometry::ShapeResponse* response) override;
 
+    grpc::Status CreateShapesBatch(grpc::ServerContext* context,
+                                  const geometry::BatchCreateRequest* request,
+                                  geometry::BatchCreateResponse* response) override;
+
     // Shape operations
     grpc::Status DeleteShape(grpc::ServerContext* context,
                             const geometry::ShapeRequest* request,
@@ -66,6 +70,10 @@ public:
                             const geometry::ShapeRequest* request,
                             geometry::MeshData* response) override;
 
+    grpc::Status GetMeshDataBatch(grpc::ServerContext* context,
+                                 const geometry::ShapeIdList* request,
+                                 grpc::ServerWriter<geometry::MeshData>* writer) override;
+
     grpc::Status GetAllMeshes(grpc::ServerContext* context,
                              const geometry::EmptyRequest* request,
                              grpc::ServerWriter<geometry::MeshData>* writer) override;
@@ -91,6 +99,14 @@ public:
                                 const geometry::ModelFileRequest* request,
                                 geometry::ModelImportResponse* response) override;
 
+    grpc::Status ImportModelFileProgress(grpc::ServerContext* context,
+                                        const geometry::ModelFileRequest* request,
+                                        grpc::ServerWriter<geometry::ImportProgress>* writer) override;
+
+    grpc::Status ImportModelStream(grpc::ServerContext* context,
+                                  grpc::ServerReader<geometry::ModelChunk>* reader,
+                                  geometry::ModelImportResponse* response) override;
+
     grpc::Status ExportModelFile(grpc::ServerContext* context,
                                 const geometry::ModelExportRequest* request,
                                 geometry::ModelFileResponse* response) override;
@@ -137,6 +153,8 @@ private:
     std::string getClientId(grpc::ServerContext* context) const;
     std::string generateShapeId();  // Deprecated - use session->generateShapeId() instead
     std::shared_ptr<ClientSession> getOrCreateSession(const std::string& client_id);
+    std::vector<std::string> moveShapesToSession(const std::shared_ptr<ClientSession>& session,
+                                                 const std::vector<std::string>& shape_ids);
     void cleanupInactiveSessions(std::chrono::minutes timeout = std::chrono::minutes(30));
     Handle(AIS_Shape) createBoxShape(const geometry::BoxRequest& request);
     Handle(AIS_Shape) createConeShape(const geometry::ConeRequest& request);
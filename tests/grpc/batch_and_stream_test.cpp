@@ -0,0 +1,179 @@
+#include <gtest/gtest.h>
+#include <spdlog/spdlog.h>
+#include <grpcpp/grpcpp.h>
+#include <fstream>
+#include <memory>
+#include <set>
+#include <sstream>
+#include <string>
+
+#include "server/geometry_service_impl.h"
+#include "geometry_service.pb.h"
+#include "geometry_service.grpc.pb.h"
+
+// Tests for the batched creation RPC (direct service calls)
+class BatchCreateTest : public ::testing::Test {
+protected:
+    void SetUp() override {
+        service_ = std::make_unique<GeometryServiceImpl>();
+        spdlog::set_level(spdlog::level::info);
+    }
+
+    std::unique_ptr<GeometryServiceImpl> service_;
+    grpc::ServerContext context_;
+};
+
+TEST_F(BatchCreateTest, AllValidSpecsShouldSucceed) {
+    geometry::BatchCreateRequest request;
+
+    auto* box = request.add_specs()->mutable_box();
+    box->mutable_position()->set_x(0);
+    box->mutable_position()->set_y(0);
+    box->mutable_position()->set_z(0);
+    box->set_width(5);
+    box->set_height(5);
+    box->set_depth(5);
+
+    auto* sphere = request.add_specs()->mutable_sphere();
+    sphere->mutable_center()->set_x(10);
+    sphere->mutable_center()->set_y(0);
+    sphere->mutable_center()->set_z(0);
+    sphere->set_radius(3);
+
+    geometry::BatchCreateResponse response;
+    auto status = service_->CreateShapesBatch(&context_, &request, &response);
+
+    EXPECT_TRUE(status.ok());
+    EXPECT_TRUE(response.success());
+    ASSERT_EQ(response.responses_size(), 2);
+
+    std::set<std::string> shape_ids;
+    for (const auto& shape_response : response.responses()) {
+        EXPECT_TRUE(shape_response.success());
+        EXPECT_FALSE(shape_response.shape_id().empty());
+        shape_ids.insert(shape_response.shape_id());
+    }
+    EXPECT_EQ(shape_ids.size(), 2); // IDs must be distinct
+}
+
+TEST_F(BatchCreateTest, MixedValidAndEmptySpecs) {
+    geometry::BatchCreateRequest request;
+
+    auto* box = request.add_specs()->mutable_box();
+    box->mutable_position()->set_x(0);
+    box->mutable_position()->set_y(0);
+    box->mutable_position()->set_z(0);
+    box->set_width(4);
+    box->set_height(4);
+    box->set_depth(4);
+
+    // Spec with no shape set (oneof left empty)
+    request.add_specs();
+
+    auto* sphere = request.add_specs()->mutable_sphere();
+    sphere->mutable_center()->set_x(0);
+    sphere->mutable_center()->set_y(10);
+    sphere->mutable_center()->set_z(0);
+    sphere->set_radius(2);
+
+    geometry::BatchCreateResponse response;
+    auto status = service_->CreateShapesBatch(&context_, &request, &response);
+
+    EXPECT_TRUE(status.ok());
+    // Aggregate success must be false when any spec fails
+    EXPECT_FALSE(response.success());
+    ASSERT_EQ(response.responses_size(), 3); // One response per spec, in order
+
+    EXPECT_TRUE(response.responses(0).success());
+    EXPECT_FALSE(response.responses(0).shape_id().empty());
+
+    EXPECT_FALSE(response.responses(1).success());
+    EXPECT_FALSE(response.responses(1).message().empty());
+
+    EXPECT_TRUE(response.responses(2).success());
+    EXPECT_FALSE(response.responses(2).shape_id().empty());
+}
+
+// Tests for the chunked upload RPC. ServerReader cannot be constructed
+// directly (it is final), so these run the service behind a real in-process
+// server and drive it through the generated client stub.
+class ModelStreamTest : public ::testing::Test {
+protected:
+    void SetUp() override {
+        service_ = std::make_unique<GeometryServiceImpl>();
+        spdlog::set_level(spdlog::level::info);
+
+        int port = 0;
+        grpc::ServerBuilder builder;
+        builder.AddListeningPort("localhost:0", grpc::InsecureServerCredentials(), &port);
+        builder.RegisterService(service_.get());
+        server_ = builder.BuildAndStart();
+        ASSERT_NE(server_, nullptr);
+
+        auto channel = grpc::CreateChannel("localhost:" + std::to_string(port),
+                                           grpc::InsecureChannelCredentials());
+        stub_ = geometry::GeometryService::NewStub(channel);
+    }
+
+    void TearDown() override {
+        server_->Shutdown();
+    }
+
+    std::unique_ptr<GeometryServiceImpl> service_;
+    std::unique_ptr<grpc::Server> server_;
+    std::unique_ptr<geometry::GeometryService::Stub> stub_;
+};
+
+TEST_F(ModelStreamTest, ChunkedUploadReassemblesFile) {
+    // Read a real model and push it through the stream in small chunks
+    std::ifstream file("tests/test_data/models/3boxes.brep", std::ios::binary);
+    ASSERT_TRUE(file.is_open());
+    std::stringstream buffer;
+    buffer << file.rdbuf();
+    std::string model_data = buffer.str();
+    ASSERT_FALSE(model_data.empty());
+
+    const size_t chunk_size = 1024; // Small on purpose: forces many chunks
+
+    grpc::ClientContext context;
+    geometry::ModelImportResponse response;
+    auto writer = stub_->ImportModelStream(&context, &response);
+
+    bool first_chunk = true;
+    for (size_t offset = 0; offset < model_data.size(); offset += chunk_size) {
+        geometry::ModelChunk chunk;
+        if (first_chunk) {
+            chunk.set_filename("3boxes.brep");
+            chunk.mutable_options()->set_auto_detect_format(true);
+            first_chunk = false;
+        }
+        chunk.set_data(model_data.substr(offset, chunk_size));
+        ASSERT_TRUE(writer->Write(chunk));
+    }
+    writer->WritesDone();
+    auto status = writer->Finish();
+
+    EXPECT_TRUE(status.ok());
+    EXPECT_TRUE(response.success()) << "Import message: " << response.message();
+    EXPECT_EQ(response.detected_format(), "BREP");
+    EXPECT_FALSE(response.shape_ids().empty());
+    // The reported file size is computed from the reassembled bytes, so it
+    // must match what was sent
+    EXPECT_EQ(response.file_info().file_size(),
+              static_cast<int64_t>(model_data.size()));
+}
+
+TEST_F(ModelStreamTest, EmptyUploadShouldFail) {
+    grpc::ClientContext context;
+    geometry::ModelImportResponse response;
+    auto writer = stub_->ImportModelStream(&context, &response);
+
+    // Close the stream without sending a single chunk
+    writer->WritesDone();
+    auto status = writer->Finish();
+
+    EXPECT_TRUE(status.ok()); // gRPC call should succeed
+    EXPECT_FALSE(response.success()); // But the import should fail
+    EXPECT_NE(response.message().find("Empty upload"), std::string::npos)
+        << "Message: " << response.message();
+}
@@ -212,6 +212,6 @@ TEST_F(ModelImportTest, ImportWithCustomPrecision) {
         auto mesh_status = service_->GetMeshData(&mesh_ctx, &mesh_request, &mesh_response);
         
         EXPECT_TRUE(mesh_status.ok());
-        EXPECT_FALSE(mesh_response.vertices().empty());
+        EXPECT_FALSE(mesh_response.vertices_raw().empty());
     }
 }
\ No newline at end of file
@@ -217,12 +217,12 @@ TEST_F(RealModelsTest, MeshGenerationForRealModels) {
         
         EXPECT_TRUE(status.ok());
         EXPECT_EQ(mesh_response.shape_id(), shape_id);
-        EXPECT_GT(mesh_response.vertices_size(), 0);
-        EXPECT_GT(mesh_response.indices_size(), 0);
-        
+        EXPECT_GT(mesh_response.vertices_raw().size(), 0);
+        EXPECT_GT(mesh_response.indices_raw().size(), 0);
+
         spdlog::info("Mesh for shape {}: {} vertices, {} indices",
-                    shape_id, mesh_response.vertices_size(),
-                    mesh_response.indices_size());
+                    shape_id, mesh_response.vertices_raw().size() / (3 * sizeof(float)),
+                    mesh_response.indices_raw().size() / sizeof(uint32_t));
     }
 }
 